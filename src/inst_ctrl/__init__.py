@@ -99,6 +99,8 @@ from inst_ctrl.psu import (
     RigolValidationError,
     RigolCommandError,
     Channel,
+    AsyncSCPIMixin,
+    InstrumentSnapshot,
 )
 
 __all__ = [
@@ -125,4 +127,6 @@ __all__ = [
     'RigolValidationError',
     'RigolCommandError',
     'Channel',
+    'AsyncSCPIMixin',
+    'InstrumentSnapshot',
 ]
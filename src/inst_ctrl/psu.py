@@ -26,14 +26,45 @@ Measure output:
     ...     current = psu.measured_current
     ...     power = psu.measured_power
     ...     print(f"V: {voltage}V, I: {current}A, P: {power}W")
+
+Drive several supplies concurrently:
+    >>> import asyncio
+    >>> async def enable_all(psus):
+    ...     await asyncio.gather(*(psu.output_on_async(Channel.CH1) for psu in psus))
 """
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import logging
+import threading
+import time
 import pyvisa
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pyvisa.resources import MessageBasedResource
 from enum import Enum
-from typing import Optional, Union, Tuple, cast
+from typing import Any, Callable, Coroutine, Deque, Dict, Iterator, List, Optional, Union, Tuple, cast
+
+logger = logging.getLogger(__name__)
+
+
+# 1 and 0 hash equal to True and False, so they are accepted as well.
+_OUTPUT_VALUE_MAP: Dict[Union[bool, int, str], str] = {
+    True: 'ON', 'ON': 'ON', 'on': 'ON',
+    False: 'OFF', 'OFF': 'OFF', 'off': 'OFF',
+}
+
+
+def _state_str(value: Union[bool, str, int]) -> Optional[str]:
+    """Return 'ON'/'OFF' for an accepted state value, or None if it is not recognized."""
+    try:
+        return _OUTPUT_VALUE_MAP.get(value)
+    except TypeError:
+        return None
 
 
 class RigolError(Exception):
@@ -87,12 +118,231 @@ class Channel(Enum):
     CH3 = 'CH3'
 
 
-class RigolDP800:
+@dataclass(frozen=True)
+class InstrumentSnapshot:
+    """
+    Identity, self-test result and error-queue head fetched in one query.
+
+    Attributes
+    ----------
+    idn : str
+        ``*IDN?`` response.
+    tst_passed : bool
+        True if ``*TST?`` returned 0.
+    tst_code : int
+        Raw ``*TST?`` result code; 0 means passed.
+    last_error : str
+        Oldest entry popped from the error queue (``:SYST:ERR?``),
+        e.g. '0,"No error"'.
+
+    Examples
+    --------
+    >>> with RigolDP800() as psu:
+    ...     snap = psu.snapshot()
+    ...     print(snap.idn, snap.tst_passed, snap.last_error)
+    """
+    idn: str
+    tst_passed: bool
+    tst_code: int
+    last_error: str
+
+
+# Constant commands are pre-encoded with their terminator for write_raw.
+_RST = b'*RST\n'
+_CLS = b'*CLS\n'
+_OUTPUT_CMD: Dict[Tuple[str, str], bytes] = {
+    (ch.value, state): f':OUTPut {ch.value},{state}\n'.encode('ascii')
+    for ch in Channel for state in ('ON', 'OFF')
+}
+_OUTPUT_STATE_QUERY: Dict[str, str] = {ch.value: f':OUTPut:STATe? {ch.value}' for ch in Channel}
+_OVP_VALUE_PREFIX: Dict[str, str] = {ch.value: f':OUTPut:OVP:VALue {ch.value},' for ch in Channel}
+_OCP_VALUE_PREFIX: Dict[str, str] = {ch.value: f':OUTPut:OCP:VALue {ch.value},' for ch in Channel}
+_OVP_STATE_CMD: Dict[Tuple[str, str], str] = {
+    (ch.value, state): f':OUTPut:OVP {ch.value},{state}' for ch in Channel for state in ('ON', 'OFF')
+}
+_OCP_STATE_CMD: Dict[Tuple[str, str], str] = {
+    (ch.value, state): f':OUTPut:OCP {ch.value},{state}' for ch in Channel for state in ('ON', 'OFF')
+}
+
+
+# Programmable OVP/OCP ranges per model and channel: (vmin, vmax, imin, imax).
+# Upper bounds are the rated output plus the 10% protection headroom.
+_DP832_LIMITS: Dict[str, Tuple[float, float, float, float]] = {
+    'CH1': (0.0, 33.0, 0.0, 3.3),
+    'CH2': (0.0, 33.0, 0.0, 3.3),
+    'CH3': (0.0, 5.5, 0.0, 3.3),
+}
+_DP831_LIMITS: Dict[str, Tuple[float, float, float, float]] = {
+    'CH1': (0.0, 8.8, 0.0, 5.5),
+    'CH2': (0.0, 33.0, 0.0, 2.2),
+    'CH3': (0.0, 33.0, 0.0, 2.2),
+}
+_DP821_LIMITS: Dict[str, Tuple[float, float, float, float]] = {
+    'CH1': (0.0, 66.0, 0.0, 1.1),
+    'CH2': (0.0, 8.8, 0.0, 11.0),
+}
+_DP811_LIMITS: Dict[str, Tuple[float, float, float, float]] = {
+    'CH1': (0.0, 44.0, 0.0, 11.0),
+}
+_CH_LIMITS: Dict[str, Dict[str, Tuple[float, float, float, float]]] = {
+    'DP832': _DP832_LIMITS,
+    'DP832A': _DP832_LIMITS,
+    'DP831': _DP831_LIMITS,
+    'DP831A': _DP831_LIMITS,
+    'DP821': _DP821_LIMITS,
+    'DP821A': _DP821_LIMITS,
+    'DP811': _DP811_LIMITS,
+    'DP811A': _DP811_LIMITS,
+}
+
+
+def _not_connected(*args: Any, **kwargs: Any) -> Any:
+    """Stand-in for the bound VISA methods while no instrument is attached."""
+    raise RigolConnectionError(
+        "Not connected to instrument. Use 'with RigolDP800() as psu:' "
+        "or call psu.connect() before using."
+    )
+
+
+# Guards lazy creation and teardown of the submit() executors.
+_executor_lock = threading.Lock()
+
+# Per-thread record of which instrument a submit() worker thread belongs to.
+_worker = threading.local()
+
+
+def _mark_worker(owner: Any) -> None:
+    """Executor initializer: tag the worker thread with its instrument."""
+    _worker.owner = owner
+
+
+def _make_async(name: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """
+    Build a coroutine method that runs the named sync method in a worker thread.
+
+    Parameters
+    ----------
+    name : str
+        Name of the synchronous method to wrap.
+
+    Returns
+    -------
+    callable
+        Coroutine function suitable for installation as ``<name>_async``.
+    """
+    async def method(self: Any, *args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(getattr(self, name), *args, **kwargs)
+
+    method.__name__ = f'{name}_async'
+    method.__doc__ = f"Asynchronous variant of ``{name}``, run via ``asyncio.to_thread``."
+    return method
+
+
+class AsyncSCPIMixin:
+    """
+    Mixin adding asyncio and executor front-ends to a blocking instrument class.
+
+    Every public method of the subclass gains an ``<name>_async`` coroutine that
+    runs the blocking call in a worker thread with ``asyncio.to_thread``. Driving
+    several instruments from one event loop then overlaps their VISA round-trips,
+    so setting up N instruments costs roughly the slowest one instead of the sum.
+
+    A VISA session does not serialize concurrent reads and writes, so subclasses
+    must guard their I/O with a per-instrument lock (as RigolDP800 does). Even
+    then calls on one instrument run one at a time; the speedup comes from using
+    one task per instrument. ``submit`` queues calls on a single worker thread
+    per instrument. Batching methods (``batch``, ``begin_batch``, ``commit``)
+    get no async variant: a batch must be opened and committed on one thread.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> async def setup(psu_a, psu_b):
+    ...     await asyncio.gather(
+    ...         psu_a.set_ovp_async(15.0, channel=Channel.CH1),
+    ...         psu_b.set_ovp_async(6.0, channel=Channel.CH3),
+    ...     )
+
+    >>> future = psu.submit('measure_all', Channel.CH1)
+    >>> voltage, current, power = future.result()
+    """
+
+    __slots__ = ()
+
+    _ASYNC_EXCLUDE = frozenset({'submit', 'batch', 'begin_batch', 'commit'})
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name in dir(cls):
+            if name.startswith('_') or name.endswith('_async') or name in cls._ASYNC_EXCLUDE:
+                continue
+            if not inspect.isfunction(inspect.getattr_static(cls, name)):
+                continue
+            async_name = f'{name}_async'
+            if async_name not in cls.__dict__:
+                setattr(cls, async_name, _make_async(name))
+
+    def submit(self, method: Union[str, Callable[..., Any]], *args: Any, **kwargs: Any) -> Future[Any]:
+        """
+        Schedule a call on this instrument's worker thread.
+
+        Calls submitted to the same instrument run one at a time, in order, on a
+        dedicated thread, so they never interleave on the VISA session.
+
+        Parameters
+        ----------
+        method : str or callable
+            Method name (e.g. 'output_on') or a callable to run.
+        *args, **kwargs
+            Arguments forwarded to the method.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future resolving to the method's return value.
+
+        Examples
+        --------
+        >>> futures = [psu.submit('output_on', Channel.CH1) for psu in psus]
+        >>> for f in futures:
+        ...     f.result()
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        with _executor_lock:
+            executor: Optional[ThreadPoolExecutor] = getattr(self, '_executor', None)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix=type(self).__name__,
+                    initializer=_mark_worker,
+                    initargs=(self,),
+                )
+                self._executor = executor
+            return executor.submit(func, *args, **kwargs)
+
+    def _shutdown_executor(self) -> None:
+        """
+        Stop the worker thread used by ``submit``, if one was started.
+
+        Waits for queued calls to finish, except when called from the worker
+        thread itself (e.g. ``submit('disconnect')``), where joining would
+        deadlock; the thread then exits after its current call.
+        """
+        with _executor_lock:
+            executor: Optional[ThreadPoolExecutor] = getattr(self, '_executor', None)
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=getattr(_worker, 'owner', None) is not self)
+
+
+class RigolDP800(AsyncSCPIMixin):
     """
     Interface for Rigol DP800 series programmable power supplies.
 
     Provides control over voltage, current, output state, and protection settings
     for up to 3 channels. Supports USB, Ethernet, GPIB, and RS-232 connections.
+    All instrument I/O is serialized by a per-instance reentrant lock, so one
+    supply can safely be shared between threads.
 
     Parameters
     ----------
@@ -106,6 +356,16 @@ class RigolDP800:
         GPIB address for GPIB connection.
     timeout : int, optional
         Communication timeout in milliseconds. Default is 5000.
+    model : str, optional
+        Model name (e.g., 'DP832'), used to range-check OVP/OCP levels before
+        they are sent. If None, the model is read from ``*IDN?`` on connect.
+        Unknown models skip the local range check.
+    async_writes : bool, optional
+        If True, setters hand their command to a background I/O thread and
+        return without waiting for the write to complete. Queries and other
+        direct I/O first wait for queued writes; a failed write raises
+        RigolCommandError from the next setter, query or ``flush()``.
+        Default is False.
 
     Attributes
     ----------
@@ -126,17 +386,35 @@ class RigolDP800:
         ...     psu.channel = Channel.CH1
         ...     psu.apply(voltage=12.0, current=2.0)
         ...     psu.output = True
+
+    Configure several supplies concurrently (one task per supply):
+        >>> async def configure(psus):
+        ...     await asyncio.gather(*(psu.apply_async(5.0, 1.0, Channel.CH1) for psu in psus))
     """
 
+    __slots__ = (
+        'rm', 'instrument', 'resource_name', 'ip_address', 'usb_serial',
+        'gpib_address', 'timeout', 'model', 'async_writes', '_active_channel',
+        '_active_channel_str', '_lock', '_batch_buf', '_batch_depth', '_snapshot_cache',
+        '_write', '_query', '_write_raw', '_io_thread',
+        '_pending_writes', '_executor',
+    )
+
     Channel = Channel
 
+    _CHUNK_SIZE = 20 * 1024
+
+    _SNAPSHOT_TTL = 1.0
+
     def __init__(
         self,
         resource_name: Optional[str] = None,
         ip_address: Optional[str] = None,
         usb_serial: Optional[str] = None,
         gpib_address: Optional[int] = None,
-        timeout: int = 5000
+        timeout: int = 5000,
+        model: Optional[str] = None,
+        async_writes: bool = False
     ) -> None:
         self.rm = pyvisa.ResourceManager()
         self.instrument: Optional[MessageBasedResource] = None
@@ -145,7 +423,19 @@ class RigolDP800:
         self.usb_serial = usb_serial
         self.gpib_address = gpib_address
         self.timeout = timeout
+        self.model = model.upper() if model else None
+        self.async_writes = async_writes
         self._active_channel = Channel.CH1
+        self._active_channel_str = Channel.CH1.value
+        self._lock = threading.RLock()
+        self._batch_buf: Optional[List[str]] = None
+        self._batch_depth = 0
+        self._snapshot_cache: Optional[Tuple[float, InstrumentSnapshot]] = None
+        self._write: Callable[..., Any] = _not_connected
+        self._query: Callable[..., str] = _not_connected
+        self._write_raw: Callable[..., Any] = _not_connected
+        self._io_thread: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: Deque[Tuple[bytes, Future[Any]]] = deque()
 
     def __enter__(self) -> RigolDP800:
         """Context manager entry."""
@@ -181,6 +471,198 @@ class RigolDP800:
         self._ensure_connected()
         return cast(MessageBasedResource, self.instrument)
 
+    def _open_resource(self, resource_string: str, timeout: int) -> MessageBasedResource:
+        """
+        Open a VISA resource and apply the DP800 session settings.
+
+        Sets newline termination, so pyvisa strips the terminator from every reply,
+        and a read chunk size large enough that any SCPI reply from the DP800
+        arrives in a single VISA read. Bulk transfers should use
+        ``query_binary_values`` rather than ASCII queries.
+
+        Parameters
+        ----------
+        resource_string : str
+            VISA resource name to open.
+        timeout : int
+            Communication timeout in milliseconds.
+
+        Returns
+        -------
+        MessageBasedResource
+            Opened and configured instrument resource.
+
+        Raises
+        ------
+        pyvisa.Error
+            If the resource cannot be opened.
+        """
+        instrument = cast(MessageBasedResource, self.rm.open_resource(resource_string))
+        instrument.timeout = timeout
+        instrument.read_termination = '\n'
+        instrument.write_termination = '\n'
+        instrument.chunk_size = self._CHUNK_SIZE
+        return instrument
+
+    def _attach(self, instrument: MessageBasedResource) -> None:
+        """
+        Make an opened resource the active instrument.
+
+        Binds ``instrument.write``, ``query`` and ``write_raw`` once so each
+        SCPI operation skips the attribute lookups. Replacing
+        ``self.instrument`` directly leaves these bound to the old resource;
+        reconnect instead.
+        """
+        self.instrument = instrument
+        self._write = instrument.write
+        self._query = instrument.query
+        self._write_raw = instrument.write_raw
+
+    def _after_writes(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a bound VISA method so it first waits for queued writes."""
+        def call(*args: Any, **kwargs: Any) -> Any:
+            self._drain()
+            return func(*args, **kwargs)
+        return call
+
+    def _send(self, command: str) -> None:
+        """
+        Write a setting command, or queue it if a batch is open.
+
+        Parameters
+        ----------
+        command : str
+            SCPI command to send.
+
+        Raises
+        ------
+        pyvisa.Error
+            If the write fails. Callers translate this into RigolCommandError.
+        """
+        with self._lock:
+            if self._batch_buf is not None:
+                self._batch_buf.append(command)
+            elif self.async_writes:
+                self._write_async(command.encode('ascii') + b'\n')
+            else:
+                self._write(command)
+
+    def _send_raw(self, message: bytes) -> None:
+        """
+        Write a pre-encoded, newline-terminated command, or queue it if a
+        batch is open.
+
+        Parameters
+        ----------
+        message : bytes
+            Encoded SCPI command including the trailing ``\\n``.
+
+        Raises
+        ------
+        pyvisa.Error
+            If the write fails. Callers translate this into RigolCommandError.
+        """
+        with self._lock:
+            if self._batch_buf is not None:
+                self._batch_buf.append(message[:-1].decode('ascii'))
+            elif self.async_writes:
+                self._write_async(message)
+            else:
+                self._write_raw(message)
+
+    def _write_async(self, message: bytes) -> None:
+        """
+        Queue a write on the I/O thread and return without waiting.
+
+        While writes are queued, ``_write``, ``_query`` and ``_write_raw`` are
+        rebound to wrappers that drain the queue first, so no other I/O can
+        overtake a queued write. Writes that have already finished are
+        dropped from the queue here, raising if one of them failed.
+
+        Parameters
+        ----------
+        message : bytes
+            Encoded SCPI command including the trailing newline.
+
+        Raises
+        ------
+        RigolCommandError
+            If an earlier queued write failed.
+        """
+        pending = self._pending_writes
+        while pending and pending[0][1].done():
+            if pending[0][1].exception() is not None:
+                self._drain()
+            pending.popleft()
+        if not pending:
+            instrument = cast(MessageBasedResource, self.instrument)
+            self._write = self._after_writes(instrument.write)
+            self._query = self._after_writes(instrument.query)
+            self._write_raw = self._after_writes(instrument.write_raw)
+        if self._io_thread is None:
+            self._io_thread = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f'{type(self).__name__}-io'
+            )
+        pending.append((message, self._io_thread.submit(self.instrument.write_raw, message)))
+
+    def _drain(self) -> None:
+        """
+        Wait for every queued write and restore direct I/O.
+
+        Raises
+        ------
+        RigolCommandError
+            If a queued write failed (the first failure is reported).
+        """
+        with self._lock:
+            pending, self._pending_writes = self._pending_writes, deque()
+            if self.instrument is not None:
+                self._attach(self.instrument)
+            failed: Optional[Tuple[bytes, BaseException]] = None
+            for message, future in pending:
+                error = future.exception()
+                if error is not None and failed is None:
+                    failed = (message, error)
+            if failed is not None:
+                raise RigolCommandError(
+                    f"Asynchronous write of {failed[0]!r} failed",
+                    pyvisa_error=cast(Exception, failed[1])
+                )
+
+    def _identify(self, idn: str) -> None:
+        """Record the model from an ``*IDN?`` reply unless one was given."""
+        if self.model is None:
+            fields = idn.split(',')
+            if len(fields) > 1:
+                self.model = fields[1].strip().upper()
+
+    def _channel_limits(self, ch: str) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Look up the OVP/OCP range for a channel of the connected model.
+
+        Parameters
+        ----------
+        ch : str
+            Channel string (e.g., 'CH1').
+
+        Returns
+        -------
+        tuple of float or None
+            ``(vmin, vmax, imin, imax)``, or None if the model is unknown.
+
+        Raises
+        ------
+        RigolValidationError
+            If the model does not have this channel.
+        """
+        limits = _CH_LIMITS.get(self.model) if self.model else None
+        if limits is None:
+            return None
+        try:
+            return limits[ch]
+        except KeyError:
+            raise RigolValidationError(f"{self.model} has no channel {ch}")
+
     def _parse_channel(self, channel: Union[Channel, str, int]) -> str:
         """
         Convert channel parameter to string format.
@@ -250,14 +732,12 @@ class RigolDP800:
         if self.usb_serial:
             try:
                 resource_string = f'USB0::0x1AB1::0x0E11::{self.usb_serial}::INSTR'
-                usb_instrument: MessageBasedResource = cast(MessageBasedResource, self.rm.open_resource(resource_string))
-                usb_instrument.timeout = self.timeout
-                usb_instrument.read_termination = '\n'
-                usb_instrument.write_termination = '\n'
+                usb_instrument = self._open_resource(resource_string, self.timeout)
                 idn = usb_instrument.query('*IDN?').strip()
                 if 'RIGOL' in idn.upper() and 'DP8' in idn.upper():
-                    self.instrument = usb_instrument
+                    self._attach(usb_instrument)
                     self.resource_name = resource_string
+                    self._identify(idn)
                     print(f"Connected to: {idn}")
                     print(f"Resource: {self.resource_name}")
                     return
@@ -276,14 +756,12 @@ class RigolDP800:
         if self.ip_address:
             try:
                 resource_string = f'TCPIP0::{self.ip_address}::INSTR'
-                ip_instrument: MessageBasedResource = cast(MessageBasedResource, self.rm.open_resource(resource_string))
-                ip_instrument.timeout = self.timeout
-                ip_instrument.read_termination = '\n'
-                ip_instrument.write_termination = '\n'
+                ip_instrument = self._open_resource(resource_string, self.timeout)
                 idn = ip_instrument.query('*IDN?').strip()
                 if 'RIGOL' in idn.upper() and 'DP8' in idn.upper():
-                    self.instrument = ip_instrument
+                    self._attach(ip_instrument)
                     self.resource_name = resource_string
+                    self._identify(idn)
                     print(f"Connected to: {idn}")
                     print(f"Resource: {self.resource_name}")
                     return
@@ -302,14 +780,12 @@ class RigolDP800:
         if self.gpib_address is not None:
             try:
                 resource_string = f'GPIB0::{self.gpib_address}::INSTR'
-                gpib_instrument: MessageBasedResource = cast(MessageBasedResource, self.rm.open_resource(resource_string))
-                gpib_instrument.timeout = self.timeout
-                gpib_instrument.read_termination = '\n'
-                gpib_instrument.write_termination = '\n'
+                gpib_instrument = self._open_resource(resource_string, self.timeout)
                 idn = gpib_instrument.query('*IDN?').strip()
                 if 'RIGOL' in idn.upper() and 'DP8' in idn.upper():
-                    self.instrument = gpib_instrument
+                    self._attach(gpib_instrument)
                     self.resource_name = resource_string
+                    self._identify(idn)
                     print(f"Connected to: {idn}")
                     print(f"Resource: {self.resource_name}")
                     return
@@ -327,12 +803,10 @@ class RigolDP800:
 
         if self.resource_name:
             try:
-                resource_instrument: MessageBasedResource = cast(MessageBasedResource, self.rm.open_resource(self.resource_name))
-                resource_instrument.timeout = self.timeout
-                resource_instrument.read_termination = '\n'
-                resource_instrument.write_termination = '\n'
+                resource_instrument = self._open_resource(self.resource_name, self.timeout)
                 idn = resource_instrument.query('*IDN?').strip()
-                self.instrument = resource_instrument
+                self._attach(resource_instrument)
+                self._identify(idn)
                 print(f"Connected to: {idn}")
                 print(f"Resource: {self.resource_name}")
                 return
@@ -355,15 +829,13 @@ class RigolDP800:
             if 'USB' not in resource and 'TCPIP' not in resource and 'GPIB' not in resource:
                 continue
             try:
-                test_instr: MessageBasedResource = cast(MessageBasedResource, self.rm.open_resource(resource))
-                test_instr.timeout = 2000
-                test_instr.read_termination = '\n'
-                test_instr.write_termination = '\n'
+                test_instr = self._open_resource(resource, 2000)
                 idn = test_instr.query('*IDN?').strip()
                 if 'RIGOL' in idn.upper() and 'DP8' in idn.upper():
-                    self.instrument = test_instr
-                    self.instrument.timeout = self.timeout
+                    test_instr.timeout = self.timeout
+                    self._attach(test_instr)
                     self.resource_name = resource
+                    self._identify(idn)
                     print(f"Connected to: {idn}")
                     print(f"Resource: {resource}")
                     return
@@ -386,10 +858,15 @@ class RigolDP800:
         """
         Close connection to instrument.
 
+        Writes still queued by ``async_writes`` are completed first.
+
         Raises
         ------
         RigolConnectionError
             If closing connection fails.
+        RigolCommandError
+            If a queued asynchronous write failed. The connection is
+            closed before this is raised.
 
         Examples
         --------
@@ -397,14 +874,31 @@ class RigolDP800:
         >>> psu.connect()
         >>> psu.disconnect()
         """
+        self._shutdown_executor()
+        self._snapshot_cache = None
+        failure: Optional[RigolCommandError] = None
+        with self._lock:
+            try:
+                self._drain()
+            except RigolCommandError as e:
+                failure = e
+            if self._io_thread is not None:
+                self._io_thread.shutdown(wait=True)
+                self._io_thread = None
         if self.instrument:
             try:
-                self.instrument.close()
+                with self._lock:
+                    self.instrument.close()
             except pyvisa.Error as e:
                 raise RigolConnectionError(
                     "Error closing instrument connection",
                     pyvisa_error=e
                 )
+            finally:
+                self.instrument = None
+                self._write = self._query = self._write_raw = _not_connected
+        if failure is not None:
+            raise failure
 
     @property
     def channel(self) -> Channel:
@@ -449,17 +943,20 @@ class RigolDP800:
         """
         if isinstance(value, Channel):
             self._active_channel = value
+            self._active_channel_str = value.value
         elif isinstance(value, str):
             ch_upper = value.upper()
             if ch_upper in ['CH1', 'CH2', 'CH3']:
                 self._active_channel = Channel[ch_upper]
+                self._active_channel_str = ch_upper
             else:
                 raise RigolValidationError(
                     f"Invalid channel '{value}'. Must be 'CH1', 'CH2', or 'CH3'"
                 )
         elif isinstance(value, int):
             if value in [1, 2, 3]:
-                self._active_channel = Channel[f'CH{value}']
+                self._active_channel_str = f'CH{value}'
+                self._active_channel = Channel[self._active_channel_str]
             else:
                 raise RigolValidationError(
                     f"Invalid channel number {value}. Must be 1, 2, or 3"
@@ -492,14 +989,14 @@ class RigolDP800:
         ...     print(f"Voltage setting: {voltage} V")
         """
         self._ensure_connected()
-        ch = self._active_channel.value
+        ch = self._active_channel_str
         channel_num = int(ch[2])
 
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':INSTrument:NSELect {channel_num}')
-            response = instrument.query(':SOURce:VOLTage?')
-            return float(response.strip())
+            with self._lock:
+                self._write(f':INSTrument:NSELect {channel_num}')
+                response = self._query(':SOURce:VOLTage?')
+                return float(response.strip())
         except ValueError:
             raise RigolCommandError(
                 f"Could not parse voltage setting. Response: {response}"
@@ -533,14 +1030,14 @@ class RigolDP800:
         ...     psu.voltage = 12
         """
         self._ensure_connected()
-        ch = self._active_channel.value
+        ch = self._active_channel_str
         voltage = float(value)
         channel_num = int(ch[2])
 
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':INSTrument:NSELect {channel_num}')
-            instrument.write(f':SOURce:VOLTage {voltage}')
+            with self._lock:
+                self._send(f':INSTrument:NSELect {channel_num}')
+                self._send(f':SOURce:VOLTage {voltage}')
         except pyvisa.Error as e:
             raise RigolCommandError(
                 f"Failed to set voltage to {voltage}V on {ch}",
@@ -570,14 +1067,14 @@ class RigolDP800:
         ...     print(f"Current limit: {current} A")
         """
         self._ensure_connected()
-        ch = self._active_channel.value
+        ch = self._active_channel_str
         channel_num = int(ch[2])
 
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':INSTrument:NSELect {channel_num}')
-            response = instrument.query(':SOURce:CURRent?')
-            return float(response.strip())
+            with self._lock:
+                self._write(f':INSTrument:NSELect {channel_num}')
+                response = self._query(':SOURce:CURRent?')
+                return float(response.strip())
         except ValueError:
             raise RigolCommandError(
                 f"Could not parse current setting. Response: {response}"
@@ -611,14 +1108,14 @@ class RigolDP800:
         ...     psu.current = 2.5
         """
         self._ensure_connected()
-        ch = self._active_channel.value
+        ch = self._active_channel_str
         current = float(value)
         channel_num = int(ch[2])
 
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':INSTrument:NSELect {channel_num}')
-            instrument.write(f':SOURce:CURRent {current}')
+            with self._lock:
+                self._send(f':INSTrument:NSELect {channel_num}')
+                self._send(f':SOURce:CURRent {current}')
         except pyvisa.Error as e:
             raise RigolCommandError(
                 f"Failed to set current to {current}A on {ch}",
@@ -652,7 +1149,9 @@ class RigolDP800:
         self._ensure_connected()
 
         if channel is None:
-            ch = self._active_channel.value
+            ch = self._active_channel_str
+        elif type(channel) is Channel:
+            ch = channel.value
         else:
             ch = self._parse_channel(channel)
 
@@ -660,8 +1159,8 @@ class RigolDP800:
         current = float(current)
 
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':APPLy {ch},{voltage},{current}')
+            with self._lock:
+                self._send(f':APPLy {ch},{voltage},{current}')
         except pyvisa.Error as e:
             raise RigolCommandError(
                 f"Failed to apply {voltage}V, {current}A to {ch}",
@@ -696,24 +1195,26 @@ class RigolDP800:
         self._ensure_connected()
 
         if channel is None:
-            ch = self._active_channel.value
+            ch = self._active_channel_str
+        elif type(channel) is Channel:
+            ch = channel.value
         else:
             ch = self._parse_channel(channel)
 
         try:
-            instrument = self._get_instrument()
-            response = instrument.query(f':APPLy? {ch}')
-            if ':' in response:
-                response = response.split(':', 1)[1]
-
-            response = response.replace('V', '').replace('A', '')
-            values = response.strip().split(',')
-
-            if len(values) >= 2:
-                return float(values[0]), float(values[1])
-            raise RigolCommandError(
-                f"Unexpected response format: {response}"
-            )
+            with self._lock:
+                response = self._query(f':APPLy? {ch}')
+                if ':' in response:
+                    response = response.split(':', 1)[1]
+
+                response = response.replace('V', '').replace('A', '')
+                values = response.strip().split(',')
+
+                if len(values) >= 2:
+                    return float(values[0]), float(values[1])
+                raise RigolCommandError(
+                    f"Unexpected response format: {response}"
+                )
         except ValueError:
             raise RigolCommandError(
                 f"Could not parse settings. Response: {response}"
@@ -747,12 +1248,12 @@ class RigolDP800:
         ...     print(f"Measured voltage: {voltage} V")
         """
         self._ensure_connected()
-        ch = self._active_channel.value
+        ch = self._active_channel_str
 
         try:
-            instrument = self._get_instrument()
-            response = instrument.query(f':MEASure:VOLTage? {ch}')
-            return float(response.strip())
+            with self._lock:
+                response = self._query(f':MEASure:VOLTage? {ch}')
+                return float(response.strip())
         except ValueError:
             raise RigolCommandError(
                 f"Could not parse voltage measurement. Response: {response}"
@@ -786,12 +1287,12 @@ class RigolDP800:
         ...     print(f"Measured current: {current} A")
         """
         self._ensure_connected()
-        ch = self._active_channel.value
+        ch = self._active_channel_str
 
         try:
-            instrument = self._get_instrument()
-            response = instrument.query(f':MEASure:CURRent? {ch}')
-            return float(response.strip())
+            with self._lock:
+                response = self._query(f':MEASure:CURRent? {ch}')
+                return float(response.strip())
         except ValueError:
             raise RigolCommandError(
                 f"Could not parse current measurement. Response: {response}"
@@ -825,12 +1326,12 @@ class RigolDP800:
         ...     print(f"Measured power: {power} W")
         """
         self._ensure_connected()
-        ch = self._active_channel.value
+        ch = self._active_channel_str
 
         try:
-            instrument = self._get_instrument()
-            response = instrument.query(f':MEASure:POWer? {ch}')
-            return float(response.strip())
+            with self._lock:
+                response = self._query(f':MEASure:POWer? {ch}')
+                return float(response.strip())
         except ValueError:
             raise RigolCommandError(
                 f"Could not parse power measurement. Response: {response}"
@@ -887,19 +1388,21 @@ class RigolDP800:
         self._ensure_connected()
 
         if channel is None:
-            ch = self._active_channel.value
+            ch = self._active_channel_str
+        elif type(channel) is Channel:
+            ch = channel.value
         else:
             ch = self._parse_channel(channel)
 
         try:
-            instrument = self._get_instrument()
-            response = instrument.query(f':MEASure:ALL? {ch}')
-            values = response.strip().split(',')
-            if len(values) >= 3:
-                return float(values[0]), float(values[1]), float(values[2])
-            raise RigolCommandError(
-                f"Unexpected response format: {response}"
-            )
+            with self._lock:
+                response = self._query(f':MEASure:ALL? {ch}')
+                values = response.strip().split(',')
+                if len(values) >= 3:
+                    return float(values[0]), float(values[1]), float(values[2])
+                raise RigolCommandError(
+                    f"Unexpected response format: {response}"
+                )
         except ValueError:
             raise RigolCommandError(
                 f"Could not parse measurements. Response: {response}"
@@ -933,12 +1436,12 @@ class RigolDP800:
         ...     print(f"Output: {'ON' if is_on else 'OFF'}")
         """
         self._ensure_connected()
-        ch = self._active_channel.value
+        ch = self._active_channel_str
 
         try:
-            instrument = self._get_instrument()
-            response = instrument.query(f':OUTPut:STATe? {ch}')
-            return response.strip().upper() in ['ON', '1']
+            with self._lock:
+                response = self._query(_OUTPUT_STATE_QUERY[ch])
+            return response.strip().upper() in ('ON', '1')
         except pyvisa.Error as e:
             raise RigolCommandError(
                 f"Failed to query output state on {ch}",
@@ -970,20 +1473,17 @@ class RigolDP800:
         ...     psu.output = 'OFF'
         """
         self._ensure_connected()
-        ch = self._active_channel.value
+        ch = self._active_channel_str
 
-        if value in [True, 'ON', 'on', 1]:
-            state_str = 'ON'
-        elif value in [False, 'OFF', 'off', 0]:
-            state_str = 'OFF'
-        else:
+        state_str = _state_str(value)
+        if state_str is None:
             raise RigolValidationError(
                 f"Invalid output state '{value}'. Must be True/False or 'ON'/'OFF'"
             )
 
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':OUTPut {ch},{state_str}')
+            with self._lock:
+                self._send_raw(_OUTPUT_CMD[ch, state_str])
         except pyvisa.Error as e:
             raise RigolCommandError(
                 f"Failed to set output to {state_str} on {ch}",
@@ -997,7 +1497,13 @@ class RigolDP800:
         Parameters
         ----------
         channel : Channel or str or int, optional
-            Channel to enable. If None, enables active channel.
+            Channel to enable. If None, enables active channel. The active
+            channel is not changed.
+
+        Raises
+        ------
+        RigolCommandError
+            If command fails.
 
         Examples
         --------
@@ -1005,13 +1511,23 @@ class RigolDP800:
         ...     psu.output_on(Channel.CH1)
         ...     psu.output_on()
         """
-        if channel is not None:
-            old_channel = self._active_channel
-            self.channel = channel
-            self.output = True
-            self._active_channel = old_channel
+        self._ensure_connected()
+
+        if channel is None:
+            ch = self._active_channel_str
+        elif type(channel) is Channel:
+            ch = channel.value
         else:
-            self.output = True
+            ch = self._parse_channel(channel)
+
+        try:
+            with self._lock:
+                self._send_raw(_OUTPUT_CMD[ch, 'ON'])
+        except pyvisa.Error as e:
+            raise RigolCommandError(
+                f"Failed to set output to ON on {ch}",
+                pyvisa_error=e
+            )
 
     def output_off(self, channel: Optional[Union[Channel, str, int]] = None) -> None:
         """
@@ -1020,7 +1536,13 @@ class RigolDP800:
         Parameters
         ----------
         channel : Channel or str or int, optional
-            Channel to disable. If None, disables active channel.
+            Channel to disable. If None, disables active channel. The active
+            channel is not changed.
+
+        Raises
+        ------
+        RigolCommandError
+            If command fails.
 
         Examples
         --------
@@ -1028,13 +1550,23 @@ class RigolDP800:
         ...     psu.output_off(Channel.CH1)
         ...     psu.output_off()
         """
-        if channel is not None:
-            old_channel = self._active_channel
-            self.channel = channel
-            self.output = False
-            self._active_channel = old_channel
+        self._ensure_connected()
+
+        if channel is None:
+            ch = self._active_channel_str
+        elif type(channel) is Channel:
+            ch = channel.value
         else:
-            self.output = False
+            ch = self._parse_channel(channel)
+
+        try:
+            with self._lock:
+                self._send_raw(_OUTPUT_CMD[ch, 'OFF'])
+        except pyvisa.Error as e:
+            raise RigolCommandError(
+                f"Failed to set output to OFF on {ch}",
+                pyvisa_error=e
+            )
 
     def set_ovp(self, value: Union[float, int], channel: Optional[Union[Channel, str, int]] = None) -> None:
         """
@@ -1049,6 +1581,8 @@ class RigolDP800:
 
         Raises
         ------
+        RigolValidationError
+            If the level is outside the channel's range for the connected model.
         RigolCommandError
             If command fails.
 
@@ -1061,15 +1595,26 @@ class RigolDP800:
         self._ensure_connected()
 
         if channel is None:
-            ch = self._active_channel.value
+            ch = self._active_channel_str
+        elif type(channel) is Channel:
+            ch = channel.value
         else:
             ch = self._parse_channel(channel)
 
         value = float(value)
 
+        limits = self._channel_limits(ch)
+        if limits is not None:
+            vmin, vmax, _, _ = limits
+            if not vmin <= value <= vmax:
+                raise RigolValidationError(
+                    f"OVP {value}V out of range for {ch} on {self.model}. "
+                    f"Valid range: {vmin}-{vmax}V"
+                )
+
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':OUTPut:OVP:VALue {ch},{value}')
+            with self._lock:
+                self._send(f'{_OVP_VALUE_PREFIX[ch]}{value}')
         except pyvisa.Error as e:
             raise RigolCommandError(
                 f"Failed to set OVP to {value}V on {ch}",
@@ -1089,6 +1634,8 @@ class RigolDP800:
 
         Raises
         ------
+        RigolValidationError
+            If the level is outside the channel's range for the connected model.
         RigolCommandError
             If command fails.
 
@@ -1101,34 +1648,47 @@ class RigolDP800:
         self._ensure_connected()
 
         if channel is None:
-            ch = self._active_channel.value
+            ch = self._active_channel_str
+        elif type(channel) is Channel:
+            ch = channel.value
         else:
             ch = self._parse_channel(channel)
 
         value = float(value)
 
+        limits = self._channel_limits(ch)
+        if limits is not None:
+            _, _, imin, imax = limits
+            if not imin <= value <= imax:
+                raise RigolValidationError(
+                    f"OCP {value}A out of range for {ch} on {self.model}. "
+                    f"Valid range: {imin}-{imax}A"
+                )
+
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':OUTPut:OCP:VALue {ch},{value}')
+            with self._lock:
+                self._send(f'{_OCP_VALUE_PREFIX[ch]}{value}')
         except pyvisa.Error as e:
             raise RigolCommandError(
                 f"Failed to set OCP to {value}A on {ch}",
                 pyvisa_error=e
             )
 
-    def enable_ovp(self, state: bool = True, channel: Optional[Union[Channel, str, int]] = None) -> None:
+    def enable_ovp(self, state: Union[bool, str, int] = True, channel: Optional[Union[Channel, str, int]] = None) -> None:
         """
         Enable or disable over-voltage protection.
 
         Parameters
         ----------
-        state : bool, optional
-            True to enable, False to disable. Default is True.
+        state : bool or str or int, optional
+            True/'ON'/1 to enable, False/'OFF'/0 to disable. Default is True.
         channel : Channel or str or int, optional
             Channel to configure. If None, uses active channel.
 
         Raises
         ------
+        RigolValidationError
+            If state is invalid.
         RigolCommandError
             If command fails.
 
@@ -1141,34 +1701,42 @@ class RigolDP800:
         self._ensure_connected()
 
         if channel is None:
-            ch = self._active_channel.value
+            ch = self._active_channel_str
+        elif type(channel) is Channel:
+            ch = channel.value
         else:
             ch = self._parse_channel(channel)
 
-        state_str = 'ON' if state else 'OFF'
+        state_str = _state_str(state)
+        if state_str is None:
+            raise RigolValidationError(
+                f"Invalid OVP state '{state}'. Must be True/False or 'ON'/'OFF'"
+            )
 
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':OUTPut:OVP {ch},{state_str}')
+            with self._lock:
+                self._send(_OVP_STATE_CMD[ch, state_str])
         except pyvisa.Error as e:
             raise RigolCommandError(
                 f"Failed to set OVP state to {state_str} on {ch}",
                 pyvisa_error=e
             )
 
-    def enable_ocp(self, state: bool = True, channel: Optional[Union[Channel, str, int]] = None) -> None:
+    def enable_ocp(self, state: Union[bool, str, int] = True, channel: Optional[Union[Channel, str, int]] = None) -> None:
         """
         Enable or disable over-current protection.
 
         Parameters
         ----------
-        state : bool, optional
-            True to enable, False to disable. Default is True.
+        state : bool or str or int, optional
+            True/'ON'/1 to enable, False/'OFF'/0 to disable. Default is True.
         channel : Channel or str or int, optional
             Channel to configure. If None, uses active channel.
 
         Raises
         ------
+        RigolValidationError
+            If state is invalid.
         RigolCommandError
             If command fails.
 
@@ -1181,21 +1749,227 @@ class RigolDP800:
         self._ensure_connected()
 
         if channel is None:
-            ch = self._active_channel.value
+            ch = self._active_channel_str
+        elif type(channel) is Channel:
+            ch = channel.value
         else:
             ch = self._parse_channel(channel)
 
-        state_str = 'ON' if state else 'OFF'
+        state_str = _state_str(state)
+        if state_str is None:
+            raise RigolValidationError(
+                f"Invalid OCP state '{state}'. Must be True/False or 'ON'/'OFF'"
+            )
 
         try:
-            instrument = self._get_instrument()
-            instrument.write(f':OUTPut:OCP {ch},{state_str}')
+            with self._lock:
+                self._send(_OCP_STATE_CMD[ch, state_str])
         except pyvisa.Error as e:
             raise RigolCommandError(
                 f"Failed to set OCP state to {state_str} on {ch}",
                 pyvisa_error=e
             )
 
+    def begin_batch(self) -> None:
+        """
+        Start queueing setting commands instead of sending them.
+
+        Setters called after this (voltage, current, apply, output, protection,
+        reset, clear_status) append their SCPI command to a buffer. Queries are
+        still sent immediately and do not see queued settings. Call commit() to
+        send the buffer.
+
+        Batches nest: opening one while another is open keeps queueing into
+        the same buffer, and only the outermost commit() sends it.
+
+        Examples
+        --------
+        >>> with RigolDP800() as psu:
+        ...     psu.begin_batch()
+        ...     psu.set_ovp(15.0)
+        ...     psu.set_ocp(2.0)
+        ...     psu.output = True
+        ...     psu.commit()
+        """
+        with self._lock:
+            if self._batch_buf is None:
+                self._batch_buf = []
+            self._batch_depth += 1
+
+    def commit(self) -> None:
+        """
+        Send all queued commands in one message and wait for completion.
+
+        The queued commands are joined with ';' and followed by '*OPC?', so the
+        whole batch costs a single round-trip. Does nothing if no commands are
+        queued, or if this closes a nested batch (the outer batch still
+        holds the commands).
+
+        Raises
+        ------
+        RigolCommandError
+            If sending the batch fails.
+
+        Examples
+        --------
+        >>> psu.begin_batch()
+        >>> psu.apply(voltage=5.0, current=1.0, channel=Channel.CH1)
+        >>> psu.output_on(Channel.CH1)
+        >>> psu.commit()
+        """
+        self._ensure_connected()
+        with self._lock:
+            if self._batch_depth > 1:
+                self._batch_depth -= 1
+                return
+            commands, self._batch_buf = self._batch_buf, None
+            self._batch_depth = 0
+            if not commands:
+                return
+            try:
+                self._query(';'.join(commands) + ';*OPC?')
+            except pyvisa.Error as e:
+                raise RigolCommandError(
+                    f"Failed to send batched commands: {commands}",
+                    pyvisa_error=e
+                )
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Queue setting commands for the duration of a with block.
+
+        The batch is committed when the block exits normally and discarded if it
+        raises. The instrument lock is held for the whole block, so other threads
+        cannot interleave commands into the batch. A nested ``batch()`` joins
+        the enclosing one; if it raises, only the commands it queued are
+        discarded.
+
+        Raises
+        ------
+        RigolCommandError
+            If sending the batch fails.
+
+        Examples
+        --------
+        >>> with RigolDP800() as psu:
+        ...     with psu.batch():
+        ...         psu.set_ovp(15.0)
+        ...         psu.set_ocp(2.0)
+        ...         psu.output = True
+        """
+        with self._lock:
+            self.begin_batch()
+            buf = cast(List[str], self._batch_buf)
+            start = len(buf)
+            try:
+                yield
+            except BaseException:
+                self._batch_depth -= 1
+                if self._batch_depth:
+                    del buf[start:]
+                else:
+                    self._batch_buf = None
+                raise
+            self.commit()
+
+    def flush(self) -> None:
+        """
+        Wait until the instrument has processed every command sent so far.
+
+        Waits for writes queued by ``async_writes``, then issues ``*OPC?``,
+        which the instrument answers only after all earlier commands complete.
+
+        Raises
+        ------
+        RigolCommandError
+            If a queued write or the query fails.
+
+        Examples
+        --------
+        >>> psu = RigolDP800(ip_address='192.168.1.100', async_writes=True)
+        >>> psu.connect()
+        >>> psu.set_ovp(15.0, channel=Channel.CH1)
+        >>> psu.output_on(Channel.CH1)
+        >>> psu.flush()
+        """
+        self._ensure_connected()
+        try:
+            with self._lock:
+                self._query('*OPC?')
+        except pyvisa.Error as e:
+            raise RigolCommandError(
+                "Failed to synchronize with instrument",
+                pyvisa_error=e
+            )
+
+    def snapshot(self, max_age: Optional[float] = None) -> InstrumentSnapshot:
+        """
+        Fetch identity, self-test result and error-queue head in one query.
+
+        Sends ``*IDN?;*TST?;:SYST:ERR?`` as a single composite query. The
+        result is cached for ``max_age`` seconds (1 s by default), so calling
+        ``check_connection()`` and ``self_test()`` back-to-back costs one
+        round-trip. Reading ``:SYST:ERR?`` pops the oldest queued error from
+        the instrument; a fresh snapshot logs that error at WARNING level on
+        the ``inst_ctrl.psu`` logger unless it is ``0`` (no error).
+
+        Parameters
+        ----------
+        max_age : float, optional
+            Maximum age in seconds of a cached snapshot that may be returned.
+            Pass 0 to force a fresh query. Default is 1.0.
+
+        Returns
+        -------
+        InstrumentSnapshot
+            Parsed identity, self-test and error-queue state.
+
+        Raises
+        ------
+        RigolCommandError
+            If the query fails or the response cannot be parsed.
+
+        Examples
+        --------
+        >>> with RigolDP800() as psu:
+        ...     snap = psu.snapshot()
+        ...     if not snap.tst_passed:
+        ...         print(f"Self-test failed, last error: {snap.last_error}")
+        """
+        self._ensure_connected()
+        if max_age is None:
+            max_age = self._SNAPSHOT_TTL
+
+        with self._lock:
+            cached = self._snapshot_cache
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < max_age:
+                return cached[1]
+
+            try:
+                response = self._query('*IDN?;*TST?;:SYST:ERR?')
+            except pyvisa.Error as e:
+                raise RigolCommandError(
+                    "Communication error while reading instrument state",
+                    pyvisa_error=e
+                )
+
+            parts = response.strip().split(';', 2)
+            try:
+                idn, tst, last_error = parts
+                tst_code = int(tst)
+            except ValueError:
+                raise RigolCommandError(
+                    f"Could not parse instrument state. Response: {response}"
+                )
+
+            snap = InstrumentSnapshot(idn.strip(), tst_code == 0, tst_code, last_error.strip())
+            self._snapshot_cache = (now, snap)
+            if snap.last_error and not snap.last_error.startswith(('0,', '+0,')):
+                logger.warning("Instrument error queue: %s", snap.last_error)
+            return snap
+
     def check_connection(self) -> bool:
         """
         Verify instrument connection and communication.
@@ -1203,7 +1977,10 @@ class RigolDP800:
         Returns
         -------
         bool
-            True if instrument responds correctly.
+            True if instrument responds correctly. The ``*IDN?`` reply is
+            logged at INFO level on the ``inst_ctrl.psu`` logger. Always
+            takes a fresh ``snapshot()``, which also pops one entry from the
+            instrument's ``:SYST:ERR?`` error queue (logged if non-zero).
 
         Raises
         ------
@@ -1212,22 +1989,16 @@ class RigolDP800:
 
         Examples
         --------
+        >>> import logging
+        >>> logging.basicConfig(level=logging.INFO)
         >>> psu = RigolDP800()
         >>> psu.connect()
         >>> if psu.check_connection():
         ...     print("Instrument is responding")
         """
-        self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            idn = instrument.query('*IDN?')
-            print(f"Instrument responding: {idn.strip()}")
-            return True
-        except pyvisa.Error as e:
-            raise RigolCommandError(
-                "Communication error during connection check",
-                pyvisa_error=e
-            )
+        snap = self.snapshot(max_age=0)
+        logger.info("Instrument responding: %s", snap.idn)
+        return True
 
     def reset(self) -> None:
         """
@@ -1245,8 +2016,9 @@ class RigolDP800:
         """
         self._ensure_connected()
         try:
-            instrument = self._get_instrument()
-            instrument.write('*RST')
+            with self._lock:
+                self._send_raw(_RST)
+                self._snapshot_cache = None
         except pyvisa.Error as e:
             raise RigolCommandError(
                 "Reset command failed",
@@ -1269,8 +2041,9 @@ class RigolDP800:
         """
         self._ensure_connected()
         try:
-            instrument = self._get_instrument()
-            instrument.write('*CLS')
+            with self._lock:
+                self._send_raw(_CLS)
+                self._snapshot_cache = None
         except pyvisa.Error as e:
             raise RigolCommandError(
                 "Clear status command failed",
@@ -1284,7 +2057,11 @@ class RigolDP800:
         Returns
         -------
         bool
-            True if self-test passes, False if it fails.
+            True if self-test passes, False if it fails. The outcome is
+            logged at INFO level on the ``inst_ctrl.psu`` logger. Uses
+            ``snapshot()``, so a result up to 1 s old may be reused; a fresh
+            query also pops one entry from the instrument's ``:SYST:ERR?``
+            error queue (logged if non-zero).
 
         Raises
         ------
@@ -1297,23 +2074,9 @@ class RigolDP800:
         ...     if psu.self_test():
         ...         print("Self-test passed")
         """
-        self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query('*TST?')
-            result = int(response.strip())
-            if result == 0:
-                print("Self-test PASSED")
-                return True
-            else:
-                print(f"Self-test FAILED with error code: {result}")
-                return False
-        except ValueError:
-            raise RigolCommandError(
-                f"Could not parse self-test result. Response: {response}"
-            )
-        except pyvisa.Error as e:
-            raise RigolCommandError(
-                "Self-test command failed",
-                pyvisa_error=e
-            )
+        snap = self.snapshot()
+        if snap.tst_passed:
+            logger.info("Self-test PASSED")
+        else:
+            logger.info("Self-test FAILED with error code: %d", snap.tst_code)
+        return snap.tst_passed
@@ -40,11 +40,22 @@ Philips PM5139 (same API, drop-in replacement):
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
+import logging
 import re
+import sys
+import threading
+import time
+import warnings
 import pyvisa
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pyvisa import constants as pyvisa_constants
 from pyvisa.resources import MessageBasedResource
-from typing import Optional, Union, List, Dict, Any, Tuple, cast
+from types import MappingProxyType
+from typing import Callable, Iterator, Mapping, Optional, Sequence, Union, List, Dict, Any, Tuple, cast
 try:
     from pint import UnitRegistry  # pyright: ignore[reportMissingImports]
 
@@ -52,6 +63,188 @@ try:
 except Exception:
     ureg = None
 
+logger = logging.getLogger(__name__)
+
+# pint unit name -> pint.Unit, shared by all instruments in this module
+_PINT_UNITS: Dict[str, Any] = {}
+
+
+def _pint_unit(name: str) -> Any:
+    """
+    Return the pint Unit for ``name``, parsing it only on first use.
+
+    Parameters
+    ----------
+    name : str
+        Pint unit name (e.g. 'hertz').
+
+    Returns
+    -------
+    pint.Unit
+        Unit from the module registry.
+    """
+    unit = _PINT_UNITS.get(name)
+    if unit is None:
+        unit = _PINT_UNITS[name] = cast(Any, ureg).Unit(name)
+    return unit
+
+
+_UNIT_MODES = frozenset(('pint', 'tuple'))
+
+_SIGLENT_USB_RE = re.compile(r'USB\d*::0x0483::0x7540::', re.IGNORECASE)
+
+# Unit suffix -> pint unit, checked in order by substring (MHZ before HZ).
+_FREQ_UNITS: Dict[str, str] = {'MHZ': 'megahertz', 'KHZ': 'kilohertz', 'HZ': 'hertz'}
+_VOLT_UNITS: Dict[str, str] = {'MV': 'millivolt', 'V': 'volt'}
+
+# Readable BSWV quantity -> (SCPI key, unit suffix table, default pint unit)
+_QUANTITY_SPEC: Dict[str, Tuple[str, Dict[str, str], str]] = {
+    'frequency': ('FRQ', _FREQ_UNITS, 'hertz'),
+    'amplitude': ('AMP', _VOLT_UNITS, 'volt'),
+    'offset': ('OFST', _VOLT_UNITS, 'volt'),
+}
+
+_BSWV_HEADER_RE = re.compile(r'C\d+:BSWV\s+(.+)')
+_OUTP_HEADER_RE = re.compile(r'C\d+:OUTP\s+(.+)')
+_LIST_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# VISA read chunk size in bytes; large enough for a full STL? waveform list
+_CHUNK_SIZE = 100 * 1024
+
+# Instrument replies are ASCII, so the numeric patterns use re.ASCII to
+# keep \d to [0-9]. _NUMBER_PATTERN is the loose "digits, dots and exponent" form.
+_NUMBER_PATTERN = r'[+-]?[\d.]+(?:[eE][+-]?\d+)?'
+_VALUE_UNIT_RE = re.compile(r'\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*(\S*)', re.ASCII)
+_NUMBER_SEARCH_RE = re.compile(rf'({_NUMBER_PATTERN})\s*(.*)', re.ASCII)
+
+# PM5139 *LRN? fields and argument patterns
+_LRN_AMPLITUDE_RE = re.compile(rf'AMPLT(?:UDE)?\s+({_NUMBER_PATTERN})', re.IGNORECASE | re.ASCII)
+_LRN_OFFSET_RE = re.compile(rf'DCOFF(?:SET)?\s+({_NUMBER_PATTERN})', re.IGNORECASE | re.ASCII)
+# PM5139 value/unit split: the unit is the whole remainder after the number
+_PM5139_VALUE_UNIT_RE = re.compile(rf'({_NUMBER_PATTERN})(.+)?', re.ASCII)
+_NUMBER_RE = re.compile(r'([+-]?[\d.]+)', re.ASCII)
+_ACON_RE = re.compile(r'AC\s*ON', re.IGNORECASE)
+_ACOFF_RE = re.compile(r'AC\s*OFF', re.IGNORECASE)
+_LOWIMP_RE = re.compile(r'LOWIMP\s*(OFF)?', re.IGNORECASE)
+
+# The PM5139 has 24 fixed arbitrary waveform slots, ARB1..ARB24.
+_PM5139_ARB_LIST: Tuple[Dict[str, str], ...] = tuple(
+    {'index': str(i), 'name': f'ARB{i}'} for i in range(1, 25)
+)
+
+# BSWV keys range-checked by _write_bswv: key -> (limits prefix, label, unit).
+_BSWV_LIMITS: Dict[str, Tuple[str, str, str]] = {
+    'FRQ': ('freq', 'Frequency', 'Hz'),
+    'AMP': ('amp', 'Amplitude', 'V'),
+    'OFST': ('offset', 'Offset', 'V'),
+    'PHSE': ('phase', 'Phase', 'degrees'),
+}
+
+_rm: Optional[pyvisa.ResourceManager] = None
+_rm_lock = threading.Lock()
+
+
+def _get_rm() -> pyvisa.ResourceManager:
+    """
+    Return the resource manager shared by all signal generator drivers.
+
+    Created on first use, so constructing several drivers opens the VISA
+    library session only once.
+    """
+    global _rm
+    if _rm is None:
+        with _rm_lock:
+            if _rm is None:
+                _rm = pyvisa.ResourceManager()
+    return _rm
+
+
+def _discover(
+    rm: pyvisa.ResourceManager,
+    resources: Sequence[str],
+    is_match: Callable[[str], bool],
+    timeout: int = 2000,
+    configure: Optional[Callable[[MessageBasedResource, str], None]] = None,
+) -> Optional[Tuple[str, MessageBasedResource, str]]:
+    """
+    Probe VISA resources concurrently and return the first matching one.
+
+    Each resource is opened in a worker thread and asked for ``*IDN?``, so
+    unresponsive resources time out in parallel instead of one after another.
+    Resources that fail to open, configure or answer (with any exception)
+    are skipped; every opened resource except the match is closed, also when
+    discovery itself is interrupted.
+
+    Parameters
+    ----------
+    rm : pyvisa.ResourceManager
+        Resource manager used to open the resources.
+    resources : sequence of str
+        VISA resource names to probe.
+    is_match : callable
+        Called with the stripped ``*IDN?`` response; returns True to accept.
+    timeout : int, optional
+        Probe timeout in milliseconds. Default is 2000.
+    configure : callable, optional
+        Called with each opened resource and its name before ``*IDN?`` is
+        sent, e.g. to set serial line parameters.
+
+    Returns
+    -------
+    tuple of (str, MessageBasedResource, str) or None
+        Resource name, open resource and ``*IDN?`` response of the first
+        match, or None if nothing matched.
+    """
+    if not resources:
+        return None
+
+    def probe(resource: str) -> Tuple[str, MessageBasedResource, str]:
+        instr = cast(MessageBasedResource, rm.open_resource(resource))
+        try:
+            instr.timeout = timeout
+            if configure is not None:
+                configure(instr, resource)
+            idn = instr.query('*IDN?').strip()
+        except BaseException:
+            instr.close()
+            raise
+        return resource, instr, idn
+
+    found: Optional[Tuple[str, MessageBasedResource, str]] = None
+    futures: Dict[Future[Tuple[str, MessageBasedResource, str]], str] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=min(8, len(resources))) as executor:
+            futures = {executor.submit(probe, resource): resource for resource in resources}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.debug("Probe of %s failed: %r", futures[future], e)
+                    continue
+                if is_match(result[2]):
+                    found = result
+                    for other in futures:
+                        other.cancel()
+                    break
+    except BaseException:
+        found = None
+        raise
+    finally:
+        # The executor has joined, so every probe has finished; close all
+        # opened resources except the one being returned.
+        for future in futures:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            result = future.result()
+            if result is not found:
+                try:
+                    result[1].close()
+                except Exception:
+                    pass
+    return found
+
 
 class SiglentError(Exception):
     """Base exception for all Siglent instrument errors."""
@@ -79,6 +272,123 @@ class SiglentCommandError(SiglentError):
         self.pyvisa_error = pyvisa_error
 
 
+def _visa_op(message: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Turn pyvisa errors raised by an instrument method into SiglentCommandError.
+
+    Parameters
+    ----------
+    message : str
+        Error message template, formatted with the method's bound arguments
+        (e.g. ``'Failed to set phase to {value} on channel {self._active_channel}'``).
+
+    Returns
+    -------
+    callable
+        Decorator for SiglentSDG2042X methods and property accessors.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(self, *args, **kwargs)
+            except pyvisa.Error as e:
+                bound = signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                raise SiglentCommandError(
+                    message.format(**bound.arguments),
+                    pyvisa_error=e
+                )
+        return wrapper
+    return decorator
+
+
+def _range_error(
+    label: str,
+    value: float,
+    unit: str,
+    lo: float,
+    hi: float,
+    prefix: Optional[str] = None,
+) -> SiglentValidationError:
+    """
+    Build the error raised when a value falls outside its limits.
+
+    Parameters
+    ----------
+    label : str
+        Parameter name used in the message, e.g. 'Frequency'.
+    value : float
+        Rejected value.
+    unit : str
+        Unit shown after the value and the range.
+    lo, hi : float
+        Valid range.
+    prefix : str, optional
+        ParameterLimits prefix. When given, the message explains how to
+        raise ``limits.<prefix>_max``.
+
+    Returns
+    -------
+    SiglentValidationError
+        Error for the caller to raise.
+    """
+    message = f"{label} {value} {unit} is outside valid range [{lo}, {hi}] {unit}."
+    if prefix is not None:
+        message += (
+            f"\nTo use this {label.lower()}, adjust the limit:\n"
+            f"  sig_gen.limits.{prefix}_max = {value}\n"
+            f"WARNING: Verify this is within your instrument's actual specifications!"
+        )
+    return SiglentValidationError(message)
+
+
+class _Limit:
+    """
+    Data descriptor for one ParameterLimits bound.
+
+    Reads and writes the matching ``_<name>`` slot and warns whenever the
+    bound is changed through the public attribute. Writes also refresh the
+    ``<prefix>_range`` tuple the setters validate against.
+
+    Parameters
+    ----------
+    label : str
+        Human-readable name used in the warning (e.g. 'frequency minimum').
+    unit : str
+        Unit used in the warning (e.g. 'Hz').
+    """
+
+    __slots__ = ('label', 'unit', 'attr', 'prefix')
+
+    def __init__(self, label: str, unit: str) -> None:
+        self.label = label
+        self.unit = unit
+        self.attr = ''
+        self.prefix = ''
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = '_' + name
+        self.prefix = name.rsplit('_', 1)[0]
+
+    def __get__(self, obj: Optional[ParameterLimits], objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj: ParameterLimits, value: float) -> None:
+        warnings.warn(
+            f"Changing {self.label} from {getattr(obj, self.attr)} {self.unit} to {value} {self.unit}. "
+            "Ensure this matches your instrument specifications!",
+            UserWarning,
+            stacklevel=2
+        )
+        setattr(obj, self.attr, value)
+        obj._refresh_range(self.prefix)
+
+
 class ParameterLimits:
     """
     Parameter limits for Siglent SDG2042X waveform generator.
@@ -104,6 +414,9 @@ class ParameterLimits:
         Minimum phase in degrees (default: 0.0).
     phase_max : float
         Maximum phase in degrees (default: 360.0).
+    freq_range, amp_range, offset_range, phase_range : tuple[float, float]
+        ``(min, max)`` pairs kept in sync with the bounds above, so setters
+        unpack one attribute per validation.
 
     Examples
     --------
@@ -112,6 +425,14 @@ class ParameterLimits:
     ...     limits.reset_to_defaults()
     """
 
+    __slots__ = (
+        '_freq_min', '_freq_max', '_amp_min', '_amp_max',
+        '_offset_min', '_offset_max', '_phase_min', '_phase_max',
+        'freq_range', 'amp_range', 'offset_range', 'phase_range',
+    )
+
+    _PREFIXES = ('freq', 'amp', 'offset', 'phase')
+
     def __init__(self) -> None:
         self._freq_min = 1e-6
         self._freq_max = 40e6
@@ -121,214 +442,16 @@ class ParameterLimits:
         self._offset_max = 10.0
         self._phase_min = 0.0
         self._phase_max = 360.0
+        self._refresh_ranges()
 
-    @property
-    def freq_min(self) -> float:
-        """
-        Minimum frequency limit in Hz.
-
-        Returns
-        -------
-        float
-            Minimum frequency in Hz.
-        """
-        return self._freq_min
-
-    @freq_min.setter
-    def freq_min(self, value: float) -> None:
-        """
-        Set minimum frequency limit.
-
-        Parameters
-        ----------
-        value : float
-            Minimum frequency in Hz.
-        """
-        print(f"WARNING: Changing frequency minimum from {self._freq_min} Hz to {value} Hz")
-        print("Ensure this matches your instrument specifications!")
-        self._freq_min = value
-
-    @property
-    def freq_max(self) -> float:
-        """
-        Maximum frequency limit in Hz.
-
-        Returns
-        -------
-        float
-            Maximum frequency in Hz.
-        """
-        return self._freq_max
-
-    @freq_max.setter
-    def freq_max(self, value: float) -> None:
-        """
-        Set maximum frequency limit.
-
-        Parameters
-        ----------
-        value : float
-            Maximum frequency in Hz.
-        """
-        print(f"WARNING: Changing frequency maximum from {self._freq_max} Hz to {value} Hz")
-        print("Ensure this matches your instrument specifications!")
-        self._freq_max = value
-
-    @property
-    def amp_min(self) -> float:
-        """
-        Minimum amplitude limit in V.
-
-        Returns
-        -------
-        float
-            Minimum amplitude in V.
-        """
-        return self._amp_min
-
-    @amp_min.setter
-    def amp_min(self, value: float) -> None:
-        """
-        Set minimum amplitude limit.
-
-        Parameters
-        ----------
-        value : float
-            Minimum amplitude in V.
-        """
-        print(f"WARNING: Changing amplitude minimum from {self._amp_min} V to {value} V")
-        print("Ensure this matches your instrument specifications!")
-        self._amp_min = value
-
-    @property
-    def amp_max(self) -> float:
-        """
-        Maximum amplitude limit in V.
-
-        Returns
-        -------
-        float
-            Maximum amplitude in V.
-        """
-        return self._amp_max
-
-    @amp_max.setter
-    def amp_max(self, value: float) -> None:
-        """
-        Set maximum amplitude limit.
-
-        Parameters
-        ----------
-        value : float
-            Maximum amplitude in V.
-        """
-        print(f"WARNING: Changing amplitude maximum from {self._amp_max} V to {value} V")
-        print("Ensure this matches your instrument specifications!")
-        self._amp_max = value
-
-    @property
-    def offset_min(self) -> float:
-        """
-        Minimum offset limit in V.
-
-        Returns
-        -------
-        float
-            Minimum offset in V.
-        """
-        return self._offset_min
-
-    @offset_min.setter
-    def offset_min(self, value: float) -> None:
-        """
-        Set minimum offset limit.
-
-        Parameters
-        ----------
-        value : float
-            Minimum offset in V.
-        """
-        print(f"WARNING: Changing offset minimum from {self._offset_min} V to {value} V")
-        print("Ensure this matches your instrument specifications!")
-        self._offset_min = value
-
-    @property
-    def offset_max(self) -> float:
-        """
-        Maximum offset limit in V.
-
-        Returns
-        -------
-        float
-            Maximum offset in V.
-        """
-        return self._offset_max
-
-    @offset_max.setter
-    def offset_max(self, value: float) -> None:
-        """
-        Set maximum offset limit.
-
-        Parameters
-        ----------
-        value : float
-            Maximum offset in V.
-        """
-        print(f"WARNING: Changing offset maximum from {self._offset_max} V to {value} V")
-        print("Ensure this matches your instrument specifications!")
-        self._offset_max = value
-
-    @property
-    def phase_min(self) -> float:
-        """
-        Minimum phase limit in degrees.
-
-        Returns
-        -------
-        float
-            Minimum phase in degrees.
-        """
-        return self._phase_min
-
-    @phase_min.setter
-    def phase_min(self, value: float) -> None:
-        """
-        Set minimum phase limit.
-
-        Parameters
-        ----------
-        value : float
-            Minimum phase in degrees.
-        """
-        print(f"WARNING: Changing phase minimum from {self._phase_min} degrees to {value} degrees")
-        print("Ensure this matches your instrument specifications!")
-        self._phase_min = value
-
-    @property
-    def phase_max(self) -> float:
-        """
-        Maximum phase limit in degrees.
-
-        Returns
-        -------
-        float
-            Maximum phase in degrees.
-        """
-        return self._phase_max
-
-    @phase_max.setter
-    def phase_max(self, value: float) -> None:
-        """
-        Set maximum phase limit.
-
-        Parameters
-        ----------
-        value : float
-            Maximum phase in degrees.
-        """
-        print(f"WARNING: Changing phase maximum from {self._phase_max} degrees to {value} degrees")
-        print("Ensure this matches your instrument specifications!")
-        self._phase_max = value
+    freq_min = _Limit('frequency minimum', 'Hz')
+    freq_max = _Limit('frequency maximum', 'Hz')
+    amp_min = _Limit('amplitude minimum', 'V')
+    amp_max = _Limit('amplitude maximum', 'V')
+    offset_min = _Limit('offset minimum', 'V')
+    offset_max = _Limit('offset maximum', 'V')
+    phase_min = _Limit('phase minimum', 'degrees')
+    phase_max = _Limit('phase maximum', 'degrees')
 
     def reset_to_defaults(self) -> None:
         """
@@ -348,8 +471,27 @@ class ParameterLimits:
         self._offset_max = 10.0
         self._phase_min = 0.0
         self._phase_max = 360.0
+        self._refresh_ranges()
         print("Parameter limits reset to factory defaults")
 
+    def _refresh_range(self, prefix: str) -> None:
+        """
+        Rebuild one ``<prefix>_range`` tuple from its min and max slots.
+
+        Parameters
+        ----------
+        prefix : str
+            Limit prefix: 'freq', 'amp', 'offset' or 'phase'.
+        """
+        lo = getattr(self, f'_{prefix}_min')
+        hi = getattr(self, f'_{prefix}_max')
+        setattr(self, f'{prefix}_range', (lo, hi))
+
+    def _refresh_ranges(self) -> None:
+        """Rebuild all range tuples; call after writing the ``_x`` slots directly."""
+        for prefix in self._PREFIXES:
+            self._refresh_range(prefix)
+
 
 class SiglentSDG2042X:
     """
@@ -370,10 +512,20 @@ class SiglentSDG2042X:
 
     Attributes
     ----------
-    VALID_WAVEFORMS : list[str]
+    VALID_WAVEFORMS : tuple[str, ...]
         Valid waveform type strings: 'SINE', 'SQUARE', 'RAMP', 'PULSE', 'NOISE', 'ARB', 'DC', 'PRBS', 'IQ'.
     limits : ParameterLimits
         Parameter validation limits.
+    cache_ttl : float
+        Seconds a ``C<n>:BSWV?`` or ``C<n>:OUTP?`` response is reused by the
+        getters. Default is 0.05; set to 0 to query the instrument on every
+        read. Setters on the same channel invalidate the cached entry.
+    pipelined : bool
+        If True, writes are queued to a background I/O thread and the caller
+        returns without waiting for the VISA write to complete. Queued writes
+        are flushed before the next query, and a failed write is raised
+        there (or from ``flush()`` or ``disconnect()``) as a
+        SiglentCommandError naming the command. Default is False.
 
     Examples
     --------
@@ -391,7 +543,17 @@ class SiglentSDG2042X:
         ...     freq = sig_gen.frequency
     """
 
-    VALID_WAVEFORMS = ['SINE', 'SQUARE', 'RAMP', 'PULSE', 'NOISE', 'ARB', 'DC', 'PRBS', 'IQ']
+    __slots__ = (
+        'rm', 'instrument', '_instr', 'resource_name', 'timeout', '_active_channel',
+        '_query_prefix', '_write_prefix', '_outp_query', '_outp_prefix',
+        'limits', '_unit_mode', '_format_quantity', 'cache_ttl', '_bswv_cache',
+        '_outp_cache', 'pipelined', '_pipeline',
+        '_pending_writes', '_batch_buf',
+    )
+
+    VALID_WAVEFORMS = ('SINE', 'SQUARE', 'RAMP', 'PULSE', 'NOISE', 'ARB', 'DC', 'PRBS', 'IQ')
+    _VALID_WAVEFORMS_SET = frozenset(VALID_WAVEFORMS)
+    _VALID_WAVEFORMS_STR = ', '.join(VALID_WAVEFORMS)
 
     def __init__(
         self,
@@ -399,14 +561,26 @@ class SiglentSDG2042X:
         timeout: int = 5000,
         unit_mode: str = 'tuple'
     ) -> None:
-        self.rm = pyvisa.ResourceManager()
+        self.rm = _get_rm()
         self.instrument: Optional[MessageBasedResource] = None
+        self._instr = cast(MessageBasedResource, None)
         self.resource_name = resource_name
         self.timeout = timeout
         self._active_channel = 1
+        self._query_prefix = 'C1:BSWV?'
+        self._write_prefix = 'C1:BSWV '
+        self._outp_query = 'C1:OUTP?'
+        self._outp_prefix = 'C1:OUTP '
         self.limits = ParameterLimits()
         self._unit_mode: Optional[str] = None
         self.unit_mode = unit_mode
+        self.cache_ttl = 0.05
+        self._bswv_cache: Dict[int, Tuple[float, str, Dict[str, str]]] = {}
+        self._outp_cache: Dict[int, Tuple[float, Dict[str, str]]] = {}
+        self.pipelined = False
+        self._pipeline: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Tuple[str, Future[Any]]] = []
+        self._batch_buf: Optional[List[str]] = None
 
     def __enter__(self) -> SiglentSDG2042X:
         """Context manager entry."""
@@ -454,11 +628,15 @@ class SiglentSDG2042X:
         >>> sig_gen = SiglentSDG2042X()
         ...     sig_gen.unit_mode = 'pint'
         """
-        if value not in ['pint', 'tuple']:
+        if value not in _UNIT_MODES:
             raise SiglentValidationError(
                 f"Unit mode must be 'pint' or 'tuple', got '{value}'"
             )
         self._unit_mode = value
+        if value == 'pint' and ureg is not None:
+            self._format_quantity = self._format_pint
+        else:
+            self._format_quantity = self._format_tuple
 
     def _ensure_connected(self) -> None:
         """Verify instrument is connected before operation."""
@@ -468,56 +646,381 @@ class SiglentSDG2042X:
                 "or call sig_gen.connect() before using properties."
             )
 
-    def _get_instrument(self) -> MessageBasedResource:
+    def _parse_parameter_response(self, response: str) -> Dict[str, str]:
         """
-        Get instrument resource with type narrowing.
+        Parse parameter response string into dictionary.
+
+        Parameters
+        ----------
+        response : str
+            Response string from instrument.
 
         Returns
         -------
-        MessageBasedResource
-            Connected instrument resource.
+        dict[str, str]
+            Dictionary of parameter key-value pairs. Keys are interned so
+            lookups with literal keys (e.g. ``params['FRQ']``) match by
+            identity.
+        """
+        header_match = _BSWV_HEADER_RE.match(response)
+        if header_match:
+            params_string = header_match.group(1)
+        else:
+            params_string = response
+
+        parts = params_string.split(',')
+        keys = map(sys.intern, map(str.strip, parts[0::2]))
+        return dict(zip(keys, map(str.strip, parts[1::2])))
+
+    def _configure_session(self, instrument: MessageBasedResource) -> None:
+        """
+        Apply the session settings used after connecting.
+
+        Sets the timeout and newline termination so pyvisa strips the
+        terminator from every reply and no per-query ``strip()`` is needed,
+        and enlarges the read chunk so long replies such as ``STL?`` arrive
+        in a single low-level read.
+
+        Parameters
+        ----------
+        instrument : MessageBasedResource
+            Opened instrument resource.
+        """
+        instrument.timeout = self.timeout
+        instrument.read_termination = '\n'
+        instrument.write_termination = '\n'
+        instrument.send_end = True
+        instrument.chunk_size = _CHUNK_SIZE
+
+    def _write(self, command: str) -> None:
+        """
+        Send a command, buffering it inside ``transaction()`` and queueing it
+        on the I/O thread in pipelined mode.
+
+        Writes queued before ``pipelined`` was switched off are drained
+        first, so a direct write never overtakes them.
+
+        Parameters
+        ----------
+        command : str
+            SCPI command.
 
         Raises
         ------
-        SiglentConnectionError
-            If instrument is not connected.
+        pyvisa.Error
+            If the write fails (immediately, when not pipelined).
+        SiglentCommandError
+            If a previously queued write failed.
+        """
+        if self._batch_buf is not None:
+            self._batch_buf.append(command)
+        elif self.pipelined:
+            self._submit(self._instr.write, command)
+        else:
+            if self._pending_writes:
+                self._drain()
+            self._instr.write(command)
+
+    def _submit(self, func: Callable[[str], Any], command: str) -> None:
+        """Queue a VISA call on the I/O thread and track it until drained."""
+        if self._pipeline is None:
+            self._pipeline = ThreadPoolExecutor(max_workers=1, thread_name_prefix='SDG-io')
+        self._pending_writes.append((command, self._pipeline.submit(func, command)))
+
+    def _query(self, command: str) -> str:
+        """
+        Send a query after any queued writes have completed.
+
+        Parameters
+        ----------
+        command : str
+            SCPI query.
+
+        Returns
+        -------
+        str
+            Instrument response.
+
+        Raises
+        ------
+        pyvisa.Error
+            If the query fails.
+        SiglentCommandError
+            If a queued write failed.
+        """
+        if self._pending_writes:
+            self._drain()
+        return self._instr.query(command)
+
+    def _drain(self) -> None:
+        """
+        Wait for queued writes and report the first one that failed.
+
+        Raises
+        ------
+        SiglentCommandError
+            If a queued write failed.
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        failed: Optional[Tuple[str, BaseException]] = None
+        for command, future in pending:
+            exc = future.exception()
+            if exc is not None and failed is None:
+                failed = (command, exc)
+        if failed is not None:
+            raise SiglentCommandError(
+                f"Queued write {failed[0]!r} failed",
+                pyvisa_error=cast(Exception, failed[1])
+            )
+
+    def flush(self) -> None:
+        """
+        Wait until all writes queued in pipelined mode have been sent.
+
+        Raises
+        ------
+        SiglentCommandError
+            If a queued write failed.
+
+        Examples
+        --------
+        >>> with SiglentSDG2042X() as sig_gen:
+        ...     sig_gen.pipelined = True
+        ...     sig_gen.frequency = 1000
+        ...     sig_gen.amplitude = 2.0
+        ...     sig_gen.flush()
+        """
+        self._drain()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Buffer setter commands for the duration of a with block.
+
+        On normal exit the buffered commands are sent as one ';'-joined
+        message; if the block raises they are discarded. Queries inside the
+        block are still sent immediately and do not see buffered settings.
+        The BSWV/OUTP caches are cleared when the block ends.
+
+        A nested ``transaction()`` joins the enclosing one: its commands are
+        sent with the outer block, and if it raises only the commands it
+        buffered are discarded.
+
+        Raises
+        ------
+        SiglentCommandError
+            If sending the buffered commands fails.
+
+        Examples
+        --------
+        >>> with SiglentSDG2042X() as sig_gen:
+        ...     with sig_gen.transaction():
+        ...         sig_gen.offset = 0
+        ...         sig_gen.phase = 45
+        ...         sig_gen.output_state = True
         """
         self._ensure_connected()
-        return cast(MessageBasedResource, self.instrument)
+        outer = self._batch_buf
+        buf = outer if outer is not None else []
+        start = len(buf)
+        self._batch_buf = buf
+        try:
+            yield
+        except BaseException:
+            if outer is None:
+                self._batch_buf = None
+            else:
+                del buf[start:]
+            raise
+        finally:
+            self._bswv_cache.clear()
+            self._outp_cache.clear()
+        if outer is not None:
+            return
+        commands, self._batch_buf = buf, None
+        if not commands:
+            return
+        try:
+            self._write(';'.join(commands))
+        except pyvisa.Error as e:
+            raise SiglentCommandError(
+                f"Failed to send batched commands: {commands}",
+                pyvisa_error=e
+            )
 
-    def _parse_parameter_response(self, response: str) -> Dict[str, str]:
+    def _query_bswv(self, ch: int) -> Dict[str, str]:
         """
-        Parse parameter response string into dictionary.
+        Query and parse the basic wave parameters of a channel.
+
+        Reuses the last parsed response for the channel if it is younger than
+        ``cache_ttl`` seconds. Each cache entry holds the timestamp, the raw
+        response and the parsed dictionary, so the response is parsed once.
 
         Parameters
         ----------
-        response : str
-            Response string from instrument.
+        ch : int
+            Channel number.
 
         Returns
         -------
         dict[str, str]
             Dictionary of parameter key-value pairs.
+
+        Raises
+        ------
+        pyvisa.Error
+            If the query fails.
+        """
+        cached = self._bswv_cache.get(ch)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[2]
+        command = self._query_prefix if ch == self._active_channel else f'C{ch}:BSWV?'
+        response = self._query(command)
+        params = self._parse_parameter_response(response)
+        self._bswv_cache[ch] = (now, response, params)
+        return params
+
+    def _parse_outp_response(self, response: str) -> Dict[str, str]:
         """
-        import re
+        Parse an output settings response into a dictionary.
+
+        The response has the form ``C1:OUTP ON,LOAD,HZ,PLRT,NOR``; the leading
+        ON/OFF field is stored under 'STATE' and the rest are key-value pairs.
 
-        header_match = re.match(r'C\d+:BSWV\s+(.+)', response)
+        Parameters
+        ----------
+        response : str
+            Response string from instrument.
+
+        Returns
+        -------
+        dict[str, str]
+            Dictionary of output parameter key-value pairs.
+        """
+        header_match = _OUTP_HEADER_RE.match(response)
         if header_match:
             params_string = header_match.group(1)
         else:
             params_string = response
 
-        params: Dict[str, str] = {}
         parts = params_string.split(',')
-        i = 0
-        while i < len(parts):
-            key = parts[i].strip() if i < len(parts) else ''
-            if i + 1 < len(parts):
-                value = parts[i + 1].strip()
-                params[key] = value
-            i += 2
+        params = {'STATE': parts[0].strip()}
+        keys = map(sys.intern, map(str.strip, parts[1::2]))
+        params.update(zip(keys, map(str.strip, parts[2::2])))
         return params
 
+    def _query_outp(self, ch: int) -> Dict[str, str]:
+        """
+        Query and parse the output settings of a channel.
+
+        Reuses the last parsed response for the channel if it is younger than
+        ``cache_ttl`` seconds.
+
+        Parameters
+        ----------
+        ch : int
+            Channel number.
+
+        Returns
+        -------
+        dict[str, str]
+            Output parameters, with the ON/OFF state under 'STATE'.
+
+        Raises
+        ------
+        pyvisa.Error
+            If the query fails.
+        """
+        cached = self._outp_cache.get(ch)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1]
+        command = self._outp_query if ch == self._active_channel else f'C{ch}:OUTP?'
+        response = self._query(command)
+        params = self._parse_outp_response(response)
+        self._outp_cache[ch] = (now, params)
+        return params
+
+    def _write_bswv(self, **kv: Union[float, int, str]) -> None:
+        """
+        Validate and write several basic wave parameters in one command.
+
+        Sends ``C<n>:BSWV KEY,VALUE,KEY,VALUE,...`` for the active channel,
+        with numbers formatted to 15 significant digits (``1000`` rather than
+        ``1000.0``) to keep the command short.
+        FRQ, AMP, OFST and PHSE are checked against ``limits`` before anything
+        is sent; other keys (e.g. WVTP) are passed through unchanged.
+
+        Parameters
+        ----------
+        **kv : float or int or str
+            BSWV parameter values keyed by SCPI name, in command order.
+
+        Raises
+        ------
+        SiglentValidationError
+            If a value is outside its limits.
+        pyvisa.Error
+            If the write fails.
+        """
+        parts = []
+        for key, value in kv.items():
+            spec = _BSWV_LIMITS.get(key)
+            if spec is not None:
+                prefix, label, unit = spec
+                value = float(value)
+                lo, hi = getattr(self.limits, f'{prefix}_range')
+                if not (lo <= value <= hi):
+                    raise _range_error(label, value, unit, lo, hi, prefix)
+            if isinstance(value, str):
+                parts.append(f'{key},{value}')
+            else:
+                parts.append(f'{key},{value:.15g}')
+
+        self._write(self._write_prefix + ','.join(parts))
+        self._bswv_cache.pop(self._active_channel, None)
+
+    def _read_quantity(self, name: str) -> Union[Any, Tuple[float, str]]:
+        """
+        Read a unit-bearing basic wave parameter of the active channel.
+
+        Parameters
+        ----------
+        name : str
+            Quantity name, one of the keys of ``_QUANTITY_SPEC``
+            ('frequency', 'amplitude' or 'offset').
+
+        Returns
+        -------
+        pint.Quantity or tuple[float, str]
+            Parameter value. Format depends on unit_mode setting.
+
+        Raises
+        ------
+        SiglentCommandError
+            If query fails or response cannot be parsed.
+        """
+        self._ensure_connected()
+        key, units, default_unit = _QUANTITY_SPEC[name]
+        try:
+            params = self._query_bswv(self._active_channel)
+        except pyvisa.Error as e:
+            raise SiglentCommandError(
+                f"Failed to query {name} on channel {self._active_channel}",
+                pyvisa_error=e
+            )
+
+        value_string = params.get(key)
+        if value_string is None:
+            raise SiglentCommandError(
+                f"Could not parse {name} from BSWV parameters: {params}"
+            )
+        value, unit_str = self._extract_value_and_unit(value_string)
+        u = unit_str.upper()
+        pint_unit = next((p for sfx, p in units.items() if sfx in u), default_unit)
+        return self._format_quantity(value, unit_str, pint_unit)
+
     def _extract_numeric_value(self, value_string: str) -> float:
         """
         Extract numeric value from string.
@@ -537,11 +1040,7 @@ class SiglentSDG2042X:
         ValueError
             If numeric value cannot be extracted.
         """
-        import re
-        match = re.match(r'([+-]?[\d.]+(?:[eE][+-]?\d+)?)', value_string)
-        if match:
-            return float(match.group(1))
-        raise ValueError(f"Could not extract numeric value from: {value_string}")
+        return self._extract_value_and_unit(value_string)[0]
 
     def _extract_value_and_unit(self, value_string: str) -> Tuple[float, str]:
         """
@@ -562,43 +1061,71 @@ class SiglentSDG2042X:
         ValueError
             If value cannot be extracted.
         """
-        import re
-        match = re.match(r'([+-]?[\d.]+(?:[eE][+-]?\d+)?)(.+)?', value_string)
+        if value_string and not value_string[-1].isalpha():
+            # Unitless replies such as '45' or '30' skip the regex
+            try:
+                return float(value_string), ''
+            except ValueError:
+                pass
+        match = _VALUE_UNIT_RE.match(value_string)
         if match:
-            value = float(match.group(1))
-            unit = match.group(2).strip() if match.group(2) else ''
-            return value, unit
+            return float(match.group(1)), match.group(2)
         raise ValueError(f"Could not extract value and unit from: {value_string}")
 
-    def _format_quantity(self, value: float, unit_str: str, pint_unit: str) -> Union[Any, Tuple[float, str]]:
+    def _format_pint(self, value: float, unit_str: str, pint_unit: str) -> Any:
         """
-        Format quantity based on unit mode.
+        Format quantity as a pint Quantity.
+
+        Bound to ``_format_quantity`` when ``unit_mode`` is 'pint' and pint is
+        installed.
 
         Parameters
         ----------
         value : float
             Numeric value.
         unit_str : str
-            Unit string.
+            Unit string (unused).
         pint_unit : str
             Pint unit string.
 
         Returns
         -------
-        pint.Quantity or tuple[float, str]
-            Formatted quantity based on unit_mode setting.
+        pint.Quantity
+            Value with its pint unit.
         """
-        if self._unit_mode == 'pint' and ureg is not None:
-            return ureg.Quantity(value, pint_unit)
-        else:
-            return (value, unit_str)
+        return value * _pint_unit(pint_unit)
+
+    def _format_tuple(self, value: float, unit_str: str, pint_unit: str) -> Tuple[float, str]:
+        """
+        Format quantity as a (value, unit) tuple.
+
+        Bound to ``_format_quantity`` in 'tuple' mode, or in 'pint' mode when
+        pint is not installed.
+
+        Parameters
+        ----------
+        value : float
+            Numeric value.
+        unit_str : str
+            Unit string.
+        pint_unit : str
+            Pint unit string (unused).
+
+        Returns
+        -------
+        tuple[float, str]
+            Tuple of (value, unit_str).
+        """
+        return (value, unit_str)
 
     def connect(self) -> None:
         """
         Establish connection to Siglent SDG2042X waveform generator.
 
         Attempts connection using resource name if provided, otherwise performs
-        auto-discovery on available VISA resources.
+        auto-discovery on available VISA resources. Discovery tries resources
+        with the Siglent USB vendor/product ID first and only probes the others
+        if none answers, up to eight at once.
 
         Raises
         ------
@@ -614,9 +1141,10 @@ class SiglentSDG2042X:
         """
         if self.resource_name:
             try:
-                self.instrument = cast(MessageBasedResource, self.rm.open_resource(self.resource_name))
-                self.instrument.timeout = self.timeout
-                idn = self.instrument.query('*IDN?').strip()
+                instr = cast(MessageBasedResource, self.rm.open_resource(self.resource_name))
+                self._configure_session(instr)
+                self.instrument = self._instr = instr
+                idn = instr.query('*IDN?')
                 print(f"Connected to: {idn}")
                 print(f"Resource: {self.resource_name}")
                 return
@@ -634,35 +1162,44 @@ class SiglentSDG2042X:
                 pyvisa_error=e
             )
 
-        for resource in resources:
-            try:
-                test_instr: MessageBasedResource = cast(MessageBasedResource, self.rm.open_resource(resource))
-                test_instr.timeout = 2000
-                idn = test_instr.query('*IDN?').strip()
-                if 'Siglent' in idn and 'SDG' in idn:
-                    self.instrument = test_instr
-                    self.instrument.timeout = self.timeout
-                    self.resource_name = resource
-                    print(f"Connected to: {idn}")
-                    print(f"Resource: {resource}")
-                    return
-                else:
-                    test_instr.close()
-            except pyvisa.Error:
-                continue
+        def is_sdg(idn: str) -> bool:
+            return 'Siglent' in idn and 'SDG' in idn
 
-        raise SiglentConnectionError(
-            "No Siglent SDG instrument found. Check connections and power."
-        )
+        # Resources with the Siglent USB VID/PID are tried on their own first;
+        # the rest are only opened if none of them answers as an SDG.
+        siglent_usb = [r for r in resources if _SIGLENT_USB_RE.search(r)]
+        found = _discover(self.rm, siglent_usb, is_sdg)
+        if found is None:
+            others = sorted(
+                (r for r in resources if not _SIGLENT_USB_RE.search(r)),
+                key=lambda r: (0 if 'USB' in r else 1 if 'TCPIP' in r else 2)
+            )
+            found = _discover(self.rm, others, is_sdg)
+        if found is None:
+            raise SiglentConnectionError(
+                "No Siglent SDG instrument found. Check connections and power."
+            )
+
+        resource, test_instr, idn = found
+        self._configure_session(test_instr)
+        self.instrument = self._instr = test_instr
+        self.resource_name = resource
+        print(f"Connected to: {idn}")
+        print(f"Resource: {resource}")
 
     def disconnect(self) -> None:
         """
         Close connection to instrument.
 
+        Writes still queued in pipelined mode are completed first.
+
         Raises
         ------
         SiglentConnectionError
             If closing connection fails.
+        SiglentCommandError
+            If a queued write failed. The connection is closed before this
+            is raised.
 
         Examples
         --------
@@ -670,6 +1207,16 @@ class SiglentSDG2042X:
         >>> sig_gen.connect()
         >>> sig_gen.disconnect()
         """
+        self._bswv_cache.clear()
+        self._outp_cache.clear()
+        failure: Optional[SiglentCommandError] = None
+        try:
+            self._drain()
+        except SiglentCommandError as e:
+            failure = e
+        if self._pipeline is not None:
+            self._pipeline.shutdown(wait=True)
+            self._pipeline = None
         if self.instrument:
             try:
                 self.instrument.close()
@@ -678,6 +1225,10 @@ class SiglentSDG2042X:
                     "Error closing instrument connection",
                     pyvisa_error=e
                 )
+            self.instrument = None
+            self._instr = cast(MessageBasedResource, None)
+        if failure is not None:
+            raise failure
 
     @property
     def channel(self) -> int:
@@ -723,6 +1274,10 @@ class SiglentSDG2042X:
                 f"Channel must be 1 or 2, got {value}"
             )
         self._active_channel = value
+        self._query_prefix = f'C{value}:BSWV?'
+        self._write_prefix = f'C{value}:BSWV '
+        self._outp_query = f'C{value}:OUTP?'
+        self._outp_prefix = f'C{value}:OUTP '
 
     @property
     def frequency(self) -> Union[Any, Tuple[float, str]]:
@@ -746,33 +1301,10 @@ class SiglentSDG2042X:
         ...     freq, unit = sig_gen.frequency
         ...     print(f"Frequency: {freq} {unit}")
         """
-        self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
-
-            if 'FRQ' in params:
-                freq_string = params['FRQ']
-                freq_value, unit_str = self._extract_value_and_unit(freq_string)
-
-                if 'KHZ' in unit_str.upper():
-                    return self._format_quantity(freq_value, unit_str, 'kilohertz')
-                elif 'MHZ' in unit_str.upper():
-                    return self._format_quantity(freq_value, unit_str, 'megahertz')
-                else:
-                    return self._format_quantity(freq_value, unit_str, 'hertz')
-
-            raise SiglentCommandError(
-                f"Could not parse frequency from response: {response}"
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query frequency on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        return self._read_quantity('frequency')
 
     @frequency.setter
+    @_visa_op("Failed to set frequency to {value} Hz on channel {self._active_channel}")
     def frequency(self, value: Union[float, int]) -> None:
         """
         Set waveform frequency.
@@ -797,24 +1329,14 @@ class SiglentSDG2042X:
         ...     sig_gen.frequency = 1e6
         """
         self._ensure_connected()
-        freq_hz = float(value)
+        lo, hi = self.limits.freq_range
+        freq_hz = value if type(value) is float else float(value)
 
-        if not (self.limits.freq_min <= freq_hz <= self.limits.freq_max):
-            raise SiglentValidationError(
-                f"Frequency {freq_hz} Hz is outside valid range [{self.limits.freq_min}, {self.limits.freq_max}] Hz.\n"
-                f"To use this frequency, adjust the limit:\n"
-                f"  sig_gen.limits.freq_max = {freq_hz}\n"
-                f"WARNING: Verify this is within your instrument's actual specifications!"
-            )
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV FRQ,{freq_hz}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set frequency to {freq_hz} Hz on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        if not (lo <= freq_hz <= hi):
+            raise _range_error('Frequency', freq_hz, 'Hz', lo, hi, 'freq')
+        cmd = f'{self._write_prefix}FRQ,{freq_hz:.15g}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
     @property
     def amplitude(self) -> Union[Any, Tuple[float, str]]:
@@ -838,31 +1360,10 @@ class SiglentSDG2042X:
         ...     amp, unit = sig_gen.amplitude
         ...     print(f"Amplitude: {amp} {unit}")
         """
-        self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
-
-            if 'AMP' in params:
-                amp_string = params['AMP']
-                amp_value, unit_str = self._extract_value_and_unit(amp_string)
-
-                if 'MV' in unit_str.upper():
-                    return self._format_quantity(amp_value, unit_str, 'millivolt')
-                else:
-                    return self._format_quantity(amp_value, unit_str, 'volt')
-
-            raise SiglentCommandError(
-                f"Could not parse amplitude from response: {response}"
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query amplitude on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        return self._read_quantity('amplitude')
 
     @amplitude.setter
+    @_visa_op("Failed to set amplitude to {value} V on channel {self._active_channel}")
     def amplitude(self, value: Union[float, int]) -> None:
         """
         Set waveform amplitude.
@@ -887,24 +1388,14 @@ class SiglentSDG2042X:
         ...     sig_gen.amplitude = 2.5
         """
         self._ensure_connected()
-        amp_v = float(value)
+        lo, hi = self.limits.amp_range
+        amp_v = value if type(value) is float else float(value)
 
-        if not (self.limits.amp_min <= amp_v <= self.limits.amp_max):
-            raise SiglentValidationError(
-                f"Amplitude {amp_v} V is outside valid range [{self.limits.amp_min}, {self.limits.amp_max}] V.\n"
-                f"To use this amplitude, adjust the limit:\n"
-                f"  sig_gen.limits.amp_max = {amp_v}\n"
-                f"WARNING: Verify this is within your instrument's actual specifications!"
-            )
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV AMP,{amp_v}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set amplitude to {amp_v} V on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        if not (lo <= amp_v <= hi):
+            raise _range_error('Amplitude', amp_v, 'V', lo, hi, 'amp')
+        cmd = f'{self._write_prefix}AMP,{amp_v:.15g}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
     @property
     def offset(self) -> Union[Any, Tuple[float, str]]:
@@ -928,31 +1419,10 @@ class SiglentSDG2042X:
         ...     offset, unit = sig_gen.offset
         ...     print(f"Offset: {offset} {unit}")
         """
-        self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
-
-            if 'OFST' in params:
-                offset_string = params['OFST']
-                offset_value, unit_str = self._extract_value_and_unit(offset_string)
-
-                if 'MV' in unit_str.upper():
-                    return self._format_quantity(offset_value, unit_str, 'millivolt')
-                else:
-                    return self._format_quantity(offset_value, unit_str, 'volt')
-
-            raise SiglentCommandError(
-                f"Could not parse offset from response: {response}"
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query offset on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        return self._read_quantity('offset')
 
     @offset.setter
+    @_visa_op("Failed to set offset to {value} V on channel {self._active_channel}")
     def offset(self, value: Union[float, int]) -> None:
         """
         Set waveform DC offset.
@@ -977,26 +1447,17 @@ class SiglentSDG2042X:
         ...     sig_gen.offset = -1.0
         """
         self._ensure_connected()
-        offset_v = float(value)
+        lo, hi = self.limits.offset_range
+        offset_v = value if type(value) is float else float(value)
 
-        if not (self.limits.offset_min <= offset_v <= self.limits.offset_max):
-            raise SiglentValidationError(
-                f"Offset {offset_v} V is outside valid range [{self.limits.offset_min}, {self.limits.offset_max}] V.\n"
-                f"To use this offset, adjust the limit:\n"
-                f"  sig_gen.limits.offset_max = {offset_v}\n"
-                f"WARNING: Verify this is within your instrument's actual specifications!"
-            )
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV OFST,{offset_v}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set offset to {offset_v} V on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        if not (lo <= offset_v <= hi):
+            raise _range_error('Offset', offset_v, 'V', lo, hi, 'offset')
+        cmd = f'{self._write_prefix}OFST,{offset_v:.15g}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
     @property
+    @_visa_op("Failed to query phase on channel {self._active_channel}")
     def phase(self) -> Union[Any, Tuple[float, str]]:
         """
         Waveform phase.
@@ -1019,26 +1480,19 @@ class SiglentSDG2042X:
         ...     print(f"Phase: {phase} {unit}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
+        params = self._query_bswv(self._active_channel)
 
-            if 'PHSE' in params:
-                phase_string = params['PHSE']
-                phase_value, unit_str = self._extract_value_and_unit(phase_string)
-                return self._format_quantity(phase_value, unit_str, 'degree')
+        if 'PHSE' in params:
+            phase_string = params['PHSE']
+            phase_value, unit_str = self._extract_value_and_unit(phase_string)
+            return self._format_quantity(phase_value, unit_str, 'degree')
 
-            raise SiglentCommandError(
-                f"Could not parse phase from response: {response}"
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query phase on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        raise SiglentCommandError(
+            f"Could not parse phase from BSWV parameters: {params}"
+        )
 
     @phase.setter
+    @_visa_op("Failed to set phase to {value} degrees on channel {self._active_channel}")
     def phase(self, value: Union[float, int]) -> None:
         """
         Set waveform phase.
@@ -1061,28 +1515,19 @@ class SiglentSDG2042X:
         ...     sig_gen.channel = 1
         ...     sig_gen.phase = 45.0
         ...     sig_gen.phase = 90
-        """
-        self._ensure_connected()
-        phase_deg = float(value)
-
-        if not (self.limits.phase_min <= phase_deg <= self.limits.phase_max):
-            raise SiglentValidationError(
-                f"Phase {phase_deg} degrees is outside valid range [{self.limits.phase_min}, {self.limits.phase_max}] degrees.\n"
-                f"To use this phase, adjust the limit:\n"
-                f"  sig_gen.limits.phase_max = {phase_deg}\n"
-                f"WARNING: Verify this is within your instrument's actual specifications!"
-            )
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV PHSE,{phase_deg}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set phase to {phase_deg} degrees on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        """
+        self._ensure_connected()
+        lo, hi = self.limits.phase_range
+        phase_deg = value if type(value) is float else float(value)
+
+        if not (lo <= phase_deg <= hi):
+            raise _range_error('Phase', phase_deg, 'degrees', lo, hi, 'phase')
+        cmd = f'{self._write_prefix}PHSE,{phase_deg:.15g}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
     @property
+    @_visa_op("Failed to query waveform type on channel {self._active_channel}")
     def waveform_type(self) -> str:
         """
         Waveform type.
@@ -1105,24 +1550,17 @@ class SiglentSDG2042X:
         ...     print(f"Waveform: {wv_type}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
+        params = self._query_bswv(self._active_channel)
 
-            if 'WVTP' in params:
-                return params['WVTP']
+        if 'WVTP' in params:
+            return params['WVTP']
 
-            raise SiglentCommandError(
-                f"Could not parse waveform type from response: {response}"
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query waveform type on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        raise SiglentCommandError(
+            f"Could not parse waveform type from BSWV parameters: {params}"
+        )
 
     @waveform_type.setter
+    @_visa_op("Failed to set waveform type to {value} on channel {self._active_channel}")
     def waveform_type(self, value: str) -> None:
         """
         Set waveform type.
@@ -1147,22 +1585,19 @@ class SiglentSDG2042X:
         ...     sig_gen.waveform_type = 'SQUARE'
         """
         self._ensure_connected()
-        if value.upper() not in self.VALID_WAVEFORMS:
+        valid = self._VALID_WAVEFORMS_SET
+        wvtp = value if value in valid else value.upper()
+        if wvtp not in valid:
             raise SiglentValidationError(
                 f"Invalid waveform type '{value}'.\n"
-                f"Valid types: {', '.join(self.VALID_WAVEFORMS)}"
-            )
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV WVTP,{value.upper()}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set waveform type to {value} on channel {self._active_channel}",
-                pyvisa_error=e
+                f"Valid types: {self._VALID_WAVEFORMS_STR}"
             )
+        cmd = f'{self._write_prefix}WVTP,{wvtp}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
     @property
+    @_visa_op("Failed to query output state on channel {self._active_channel}")
     def output_state(self) -> bool:
         """
         Output enable state.
@@ -1185,23 +1620,16 @@ class SiglentSDG2042X:
         ...     print(f"Output: {'ON' if is_on else 'OFF'}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:OUTP?').strip()
-            params = response.split(',')
-            if len(params) > 0:
-                state = params[0].strip()
-                return state == 'ON'
-            raise SiglentCommandError(
-                f"Could not parse output state from response: {response}"
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query output state on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        params = self._query_outp(self._active_channel)
+        state = params['STATE']
+        if state == 'ON' or state == 'OFF':
+            return state == 'ON'
+        raise SiglentCommandError(
+            f"Could not parse output state from OUTP parameters: {params}"
+        )
 
     @output_state.setter
+    @_visa_op("Failed to set output state to {value} on channel {self._active_channel}")
     def output_state(self, value: bool) -> None:
         """
         Enable or disable output.
@@ -1225,17 +1653,12 @@ class SiglentSDG2042X:
         """
         self._ensure_connected()
         state_str = 'ON' if value else 'OFF'
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:OUTP {state_str}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set output state to {state_str} on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        cmd = self._outp_prefix + state_str
+        self._write(cmd)
+        self._outp_cache.pop(self._active_channel, None)
 
     @property
+    @_visa_op("Failed to query load impedance on channel {self._active_channel}")
     def load_impedance(self) -> Union[Any, Tuple[float, str], str]:
         """
         Load impedance setting.
@@ -1259,30 +1682,22 @@ class SiglentSDG2042X:
         ...     print(f"Load: {load}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:OUTP?').strip()
-            params = response.split(',')
-            for i, param in enumerate(params):
-                if 'LOAD' in param and i + 1 < len(params):
-                    load_value = params[i + 1].strip()
-                    if load_value == 'HZ':
-                        return 'HiZ'
-                    try:
-                        load_num = float(load_value)
-                        return self._format_quantity(load_num, load_value, 'ohm')
-                    except ValueError:
-                        return load_value
-            raise SiglentCommandError(
-                f"Could not parse load impedance from response: {response}"
-            )
-        except pyvisa.Error as e:
+        params = self._query_outp(self._active_channel)
+        load_value = params.get('LOAD')
+        if load_value is None:
             raise SiglentCommandError(
-                f"Failed to query load impedance on channel {self._active_channel}",
-                pyvisa_error=e
+                f"Could not parse load impedance from OUTP parameters: {params}"
             )
+        if load_value == 'HZ':
+            return 'HiZ'
+        try:
+            load_num = float(load_value)
+            return self._format_quantity(load_num, load_value, 'ohm')
+        except ValueError:
+            return load_value
 
     @load_impedance.setter
+    @_visa_op("Failed to set load impedance to {value} on channel {self._active_channel}")
     def load_impedance(self, value: Union[str, int, float]) -> None:
         """
         Set load impedance.
@@ -1311,17 +1726,11 @@ class SiglentSDG2042X:
         else:
             load_str = str(int(value))
 
-        try:
-            instrument = self._get_instrument()
-            current_state = 'ON' if self.output_state else 'OFF'
-            cmd = f'C{self._active_channel}:OUTP {current_state},LOAD,{load_str}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set load impedance to {load_str} on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        cmd = f'{self._outp_prefix}LOAD,{load_str}'
+        self._write(cmd)
+        self._outp_cache.pop(self._active_channel, None)
 
+    @_visa_op("Communication error during connection check")
     def check_connection(self) -> bool:
         """
         Verify instrument connection and communication.
@@ -1329,7 +1738,8 @@ class SiglentSDG2042X:
         Returns
         -------
         bool
-            True if instrument responds correctly.
+            True if instrument responds correctly. The ``*IDN?`` reply is
+            logged at DEBUG level on the ``inst_ctrl.sig_gen`` logger.
 
         Raises
         ------
@@ -1344,21 +1754,18 @@ class SiglentSDG2042X:
         ...     print("Instrument is responding")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            idn = instrument.query('*IDN?')
-            print(f"Instrument responding: {idn.strip()}")
-            return True
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                "Communication error during connection check",
-                pyvisa_error=e
-            )
+        idn = self._query('*IDN?')
+        logger.debug("Instrument responding: %s", idn)
+        return True
 
+    @_visa_op("Reset command failed")
     def reset(self) -> None:
         """
         Reset instrument to default state.
 
+        In pipelined mode the reset is queued as ``*RST;*OPC?``; call
+        ``flush()`` to wait until the instrument has finished it.
+
         Raises
         ------
         SiglentCommandError
@@ -1370,15 +1777,14 @@ class SiglentSDG2042X:
         ...     sig_gen.reset()
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            instrument.write('*RST')
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                "Reset command failed",
-                pyvisa_error=e
-            )
+        self._bswv_cache.clear()
+        self._outp_cache.clear()
+        if not self.pipelined:
+            self._write('*RST')
+        else:
+            self._submit(self._instr.query, '*RST;*OPC?')
 
+    @_visa_op("Failed to retrieve waveform list")
     def list_waveforms(self) -> List[Dict[str, str]]:
         """
         List available arbitrary waveforms stored in instrument.
@@ -1401,23 +1807,11 @@ class SiglentSDG2042X:
         ...         print(f"Index {wv['index']}: {wv['name']}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query('STL?').strip()
-            waveforms: List[Dict[str, str]] = []
-            parts = response.split(',')
-            for i in range(0, len(parts), 2):
-                if i + 1 < len(parts):
-                    index = parts[i].strip()
-                    name = parts[i + 1].strip().strip('"')
-                    waveforms.append({'index': index, 'name': name})
-            return waveforms
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                "Failed to retrieve waveform list",
-                pyvisa_error=e
-            )
+        response = self._query('STL?')
+        it = iter(_LIST_SPLIT_RE.split(response.strip()))
+        return [{'index': index, 'name': name.strip('"')} for index, name in zip(it, it)]
 
+    @_visa_op("Failed to query duty cycle on channel {self._active_channel}")
     def get_duty_cycle(self) -> Union[Any, Tuple[float, str]]:
         """
         Get duty cycle for SQUARE or PULSE waveforms.
@@ -1441,26 +1835,22 @@ class SiglentSDG2042X:
         ...     print(f"Duty cycle: {duty} {unit}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
+        params = self._query_bswv(self._active_channel)
 
-            if 'DUTY' in params:
-                duty_string = params['DUTY']
-                duty_value, unit_str = self._extract_value_and_unit(duty_string)
-                return self._format_quantity(duty_value, unit_str, 'percent')
+        if 'DUTY' in params:
+            duty_string = params['DUTY']
+            duty_value, unit_str = self._extract_value_and_unit(duty_string)
+            return self._format_quantity(duty_value, unit_str, 'percent')
 
-            raise SiglentCommandError(
-                f"Could not parse duty cycle from response: {response}. "
-                f"Duty cycle only available for SQUARE/PULSE waveforms."
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query duty cycle on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        raise SiglentCommandError(
+            f"Could not parse duty cycle from BSWV parameters: {params}. "
+            f"Duty cycle only available for SQUARE/PULSE waveforms."
+        )
 
+    @_visa_op(
+        "Failed to set duty cycle to {duty}% on channel {self._active_channel}. "
+        "Ensure waveform type is SQUARE or PULSE."
+    )
     def set_duty_cycle(self, duty: Union[float, int]) -> None:
         """
         Set duty cycle for SQUARE or PULSE waveforms.
@@ -1491,17 +1881,11 @@ class SiglentSDG2042X:
             raise SiglentValidationError(
                 f"Duty cycle must be between 0 and 100%, got {duty_percent}%"
             )
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV DUTY,{duty_percent}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set duty cycle to {duty_percent}% on channel {self._active_channel}. "
-                f"Ensure waveform type is SQUARE or PULSE.",
-                pyvisa_error=e
-            )
+        cmd = f'{self._write_prefix}DUTY,{duty_percent:.15g}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
+    @_visa_op("Failed to query symmetry on channel {self._active_channel}")
     def get_symmetry(self) -> Union[Any, Tuple[float, str]]:
         """
         Get symmetry for RAMP waveforms.
@@ -1525,26 +1909,22 @@ class SiglentSDG2042X:
         ...     print(f"Symmetry: {sym} {unit}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
+        params = self._query_bswv(self._active_channel)
 
-            if 'SYM' in params:
-                sym_string = params['SYM']
-                sym_value, unit_str = self._extract_value_and_unit(sym_string)
-                return self._format_quantity(sym_value, unit_str, 'percent')
+        if 'SYM' in params:
+            sym_string = params['SYM']
+            sym_value, unit_str = self._extract_value_and_unit(sym_string)
+            return self._format_quantity(sym_value, unit_str, 'percent')
 
-            raise SiglentCommandError(
-                f"Could not parse symmetry from response: {response}. "
-                f"Symmetry only available for RAMP waveforms."
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query symmetry on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        raise SiglentCommandError(
+            f"Could not parse symmetry from BSWV parameters: {params}. "
+            f"Symmetry only available for RAMP waveforms."
+        )
 
+    @_visa_op(
+        "Failed to set symmetry to {symmetry}% on channel {self._active_channel}. "
+        "Ensure waveform type is RAMP."
+    )
     def set_symmetry(self, symmetry: Union[float, int]) -> None:
         """
         Set symmetry for RAMP waveforms.
@@ -1575,17 +1955,11 @@ class SiglentSDG2042X:
             raise SiglentValidationError(
                 f"Symmetry must be between 0 and 100%, got {sym_percent}%"
             )
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV SYM,{sym_percent}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set symmetry to {sym_percent}% on channel {self._active_channel}. "
-                f"Ensure waveform type is RAMP.",
-                pyvisa_error=e
-            )
+        cmd = f'{self._write_prefix}SYM,{sym_percent:.15g}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
+    @_visa_op("Failed to query pulse width on channel {self._active_channel}")
     def get_pulse_width(self) -> Union[Any, Tuple[float, str]]:
         """
         Get pulse width for PULSE waveforms.
@@ -1609,26 +1983,22 @@ class SiglentSDG2042X:
         ...     print(f"Pulse width: {width} {unit}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
+        params = self._query_bswv(self._active_channel)
 
-            if 'WIDTH' in params:
-                width_string = params['WIDTH']
-                width_value, unit_str = self._extract_value_and_unit(width_string)
-                return self._format_quantity(width_value, unit_str, 'second')
+        if 'WIDTH' in params:
+            width_string = params['WIDTH']
+            width_value, unit_str = self._extract_value_and_unit(width_string)
+            return self._format_quantity(width_value, unit_str, 'second')
 
-            raise SiglentCommandError(
-                f"Could not parse pulse width from response: {response}. "
-                f"Pulse width only available for PULSE waveforms."
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query pulse width on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        raise SiglentCommandError(
+            f"Could not parse pulse width from BSWV parameters: {params}. "
+            f"Pulse width only available for PULSE waveforms."
+        )
 
+    @_visa_op(
+        "Failed to set pulse width to {width} s on channel {self._active_channel}. "
+        "Ensure waveform type is PULSE."
+    )
     def set_pulse_width(self, width: Union[float, int]) -> None:
         """
         Set pulse width for PULSE waveforms.
@@ -1653,17 +2023,11 @@ class SiglentSDG2042X:
         self._ensure_connected()
         width_s = float(width)
 
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV WIDTH,{width_s}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set pulse width to {width_s} s on channel {self._active_channel}. "
-                f"Ensure waveform type is PULSE.",
-                pyvisa_error=e
-            )
+        cmd = f'{self._write_prefix}WIDTH,{width_s:.15g}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
+    @_visa_op("Failed to query rise time on channel {self._active_channel}")
     def get_rise_time(self) -> Union[Any, Tuple[float, str]]:
         """
         Get rise time for PULSE waveforms.
@@ -1687,26 +2051,22 @@ class SiglentSDG2042X:
         ...     print(f"Rise time: {rise} {unit}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
+        params = self._query_bswv(self._active_channel)
 
-            if 'RISE' in params:
-                rise_string = params['RISE']
-                rise_value, unit_str = self._extract_value_and_unit(rise_string)
-                return self._format_quantity(rise_value, unit_str, 'second')
+        if 'RISE' in params:
+            rise_string = params['RISE']
+            rise_value, unit_str = self._extract_value_and_unit(rise_string)
+            return self._format_quantity(rise_value, unit_str, 'second')
 
-            raise SiglentCommandError(
-                f"Could not parse rise time from response: {response}. "
-                f"Rise time only available for PULSE waveforms."
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query rise time on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        raise SiglentCommandError(
+            f"Could not parse rise time from BSWV parameters: {params}. "
+            f"Rise time only available for PULSE waveforms."
+        )
 
+    @_visa_op(
+        "Failed to set rise time to {rise_time} s on channel {self._active_channel}. "
+        "Ensure waveform type is PULSE."
+    )
     def set_rise_time(self, rise_time: Union[float, int]) -> None:
         """
         Set rise time for PULSE waveforms.
@@ -1731,17 +2091,11 @@ class SiglentSDG2042X:
         self._ensure_connected()
         rise_s = float(rise_time)
 
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV RISE,{rise_s}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set rise time to {rise_s} s on channel {self._active_channel}. "
-                f"Ensure waveform type is PULSE.",
-                pyvisa_error=e
-            )
+        cmd = f'{self._write_prefix}RISE,{rise_s:.15g}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
+    @_visa_op("Failed to query fall time on channel {self._active_channel}")
     def get_fall_time(self) -> Union[Any, Tuple[float, str]]:
         """
         Get fall time for PULSE waveforms.
@@ -1765,26 +2119,22 @@ class SiglentSDG2042X:
         ...     print(f"Fall time: {fall} {unit}")
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            params = self._parse_parameter_response(response)
+        params = self._query_bswv(self._active_channel)
 
-            if 'FALL' in params:
-                fall_string = params['FALL']
-                fall_value, unit_str = self._extract_value_and_unit(fall_string)
-                return self._format_quantity(fall_value, unit_str, 'second')
+        if 'FALL' in params:
+            fall_string = params['FALL']
+            fall_value, unit_str = self._extract_value_and_unit(fall_string)
+            return self._format_quantity(fall_value, unit_str, 'second')
 
-            raise SiglentCommandError(
-                f"Could not parse fall time from response: {response}. "
-                f"Fall time only available for PULSE waveforms."
-            )
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query fall time on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        raise SiglentCommandError(
+            f"Could not parse fall time from BSWV parameters: {params}. "
+            f"Fall time only available for PULSE waveforms."
+        )
 
+    @_visa_op(
+        "Failed to set fall time to {fall_time} s on channel {self._active_channel}. "
+        "Ensure waveform type is PULSE."
+    )
     def set_fall_time(self, fall_time: Union[float, int]) -> None:
         """
         Set fall time for PULSE waveforms.
@@ -1809,17 +2159,11 @@ class SiglentSDG2042X:
         self._ensure_connected()
         fall_s = float(fall_time)
 
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV FALL,{fall_s}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to set fall time to {fall_s} s on channel {self._active_channel}. "
-                f"Ensure waveform type is PULSE.",
-                pyvisa_error=e
-            )
+        cmd = f'{self._write_prefix}FALL,{fall_s:.15g}'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
 
+    @_visa_op("Failed to select arbitrary waveform. Use list_waveforms() to verify selection.")
     def select_arbitrary_waveform(self, index: Optional[int] = None, name: Optional[str] = None) -> None:
         """
         Select arbitrary waveform by index or name.
@@ -1856,19 +2200,17 @@ class SiglentSDG2042X:
             raise SiglentValidationError(
                 "Specify either 'index' or 'name', not both."
             )
-        try:
-            instrument = self._get_instrument()
-            if index is not None:
-                cmd = f'C{self._active_channel}:ARWV INDEX,{index}'
-            else:
-                cmd = f'C{self._active_channel}:ARWV NAME,"{name}"'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to select arbitrary waveform. Use list_waveforms() to verify selection.",
-                pyvisa_error=e
-            )
-
+        if index is not None:
+            cmd = f'C{self._active_channel}:ARWV INDEX,{index}'
+        else:
+            cmd = f'C{self._active_channel}:ARWV NAME,"{name}"'
+        self._write(cmd)
+        self._bswv_cache.pop(self._active_channel, None)
+
+    @_visa_op(
+        "Failed to configure waveform with parameters: type={waveform_type}, "
+        "freq={frequency}, amp={amplitude}, offset={offset}, phase={phase}"
+    )
     def configure_waveform(
         self,
         waveform_type: str,
@@ -1909,52 +2251,182 @@ class SiglentSDG2042X:
         """
         self._ensure_connected()
 
-        if waveform_type.upper() not in self.VALID_WAVEFORMS:
+        valid = self._VALID_WAVEFORMS_SET
+        wvtp = waveform_type if waveform_type in valid else waveform_type.upper()
+        if wvtp not in valid:
             raise SiglentValidationError(
                 f"Invalid waveform type '{waveform_type}'.\n"
-                f"Valid types: {', '.join(self.VALID_WAVEFORMS)}"
+                f"Valid types: {self._VALID_WAVEFORMS_STR}"
             )
 
-        freq_hz = float(frequency)
-        amp_v = float(amplitude)
-        offset_v = float(offset)
-        phase_deg = float(phase)
+        self._write_bswv(
+            WVTP=wvtp,
+            FRQ=frequency,
+            AMP=amplitude,
+            OFST=offset,
+            PHSE=phase,
+        )
 
-        if not (self.limits.freq_min <= freq_hz <= self.limits.freq_max):
-            raise SiglentValidationError(
-                f"Frequency {freq_hz} Hz is outside valid range [{self.limits.freq_min}, {self.limits.freq_max}] Hz.\n"
-                f"To use this frequency, adjust the limit:\n"
-                f"  sig_gen.limits.freq_max = {freq_hz}\n"
-                f"WARNING: Verify this is within your instrument's actual specifications!"
-            )
+    @_visa_op("Failed to update BSWV parameters {params} on channel {self._active_channel}")
+    def update_bswv(self, **params: Union[float, int, str]) -> None:
+        """
+        Set several basic wave parameters in a single command.
 
-        if not (self.limits.amp_min <= amp_v <= self.limits.amp_max):
-            raise SiglentValidationError(
-                f"Amplitude {amp_v} V is outside valid range [{self.limits.amp_min}, {self.limits.amp_max}] V.\n"
-                f"To use this amplitude, adjust the limit:\n"
-                f"  sig_gen.limits.amp_max = {amp_v}\n"
-                f"WARNING: Verify this is within your instrument's actual specifications!"
-            )
+        Sends one ``C<n>:BSWV KEY,VALUE,...`` write for the active channel
+        instead of one write per parameter. Keys are SCPI BSWV names and are
+        sent in the order given.
 
-        if not (self.limits.offset_min <= offset_v <= self.limits.offset_max):
-            raise SiglentValidationError(
-                f"Offset {offset_v} V is outside valid range [{self.limits.offset_min}, {self.limits.offset_max}] V.\n"
-                f"To use this offset, adjust the limit:\n"
-                f"  sig_gen.limits.offset_max = {offset_v}\n"
-                f"WARNING: Verify this is within your instrument's actual specifications!"
-            )
+        Parameters
+        ----------
+        **params : float or int or str
+            Parameter values keyed by SCPI name, e.g. WVTP, FRQ, AMP, OFST,
+            PHSE, DUTY, SYM, WIDTH, RISE, FALL.
 
-        try:
-            instrument = self._get_instrument()
-            cmd = f'C{self._active_channel}:BSWV WVTP,{waveform_type.upper()},FRQ,{freq_hz},AMP,{amp_v},OFST,{offset_v},PHSE,{phase_deg}'
-            instrument.write(cmd)
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to configure waveform with parameters: type={waveform_type}, "
-                f"freq={freq_hz}, amp={amp_v}, offset={offset_v}, phase={phase_deg}",
-                pyvisa_error=e
-            )
+        Raises
+        ------
+        SiglentValidationError
+            If no parameters are given, the waveform type is invalid, or a
+            value is outside its valid range.
+        SiglentCommandError
+            If command fails.
+
+        Examples
+        --------
+        >>> with SiglentSDG2042X() as sig_gen:
+        ...     sig_gen.channel = 1
+        ...     sig_gen.update_bswv(WVTP='PULSE', FRQ=1000, WIDTH=1e-4, RISE=1e-8, FALL=1e-8)
+        """
+        self._ensure_connected()
+
+        if not params:
+            raise SiglentValidationError("At least one BSWV parameter must be specified")
+
+        kv: Dict[str, Union[float, int, str]] = {}
+        for key, value in params.items():
+            key = key.upper()
+            if key == 'WVTP':
+                value = str(value).upper()
+                if value not in self._VALID_WAVEFORMS_SET:
+                    raise SiglentValidationError(
+                        f"Invalid waveform type '{value}'.\n"
+                        f"Valid types: {self._VALID_WAVEFORMS_STR}"
+                    )
+            elif key in ('DUTY', 'SYM'):
+                value = float(value)
+                if not (0 <= value <= 100):
+                    raise SiglentValidationError(
+                        f"{key} must be between 0 and 100%, got {value}%"
+                    )
+            kv[key] = value
+
+        self._write_bswv(**kv)
+
+    @_visa_op("Failed to query waveform parameters on channel {self._active_channel}")
+    def get_waveform_state(self) -> Dict[str, str]:
+        """
+        Get all basic wave parameters of the active channel in one query.
+
+        Returns
+        -------
+        dict[str, str]
+            Parameter strings keyed by SCPI name (e.g. 'WVTP', 'FRQ', 'AMP',
+            'OFST', 'PHSE'), with units as reported by the instrument.
+
+        Raises
+        ------
+        SiglentCommandError
+            If query fails.
+
+        Examples
+        --------
+        >>> with SiglentSDG2042X() as sig_gen:
+        ...     sig_gen.channel = 1
+        ...     state = sig_gen.get_waveform_state()
+        ...     print(state['FRQ'], state['AMP'], state['OFST'])
+        """
+        self._ensure_connected()
+        return dict(self._query_bswv(self._active_channel))
+
+    def snapshot(self, channels: Sequence[int] = (1, 2)) -> Dict[int, Dict[str, Dict[str, str]]]:
+        """
+        Read the basic wave and output settings of several channels.
+
+        Issues one ``C<n>:BSWV?`` and one ``C<n>:OUTP?`` per channel (or
+        reuses cached replies younger than ``cache_ttl``) without changing
+        the active channel.
+
+        Parameters
+        ----------
+        channels : sequence of int, optional
+            Channels to read. Default is (1, 2).
+
+        Returns
+        -------
+        dict[int, dict[str, dict[str, str]]]
+            ``{channel: {'BSWV': {...}, 'OUTP': {...}}}`` with parameter
+            strings keyed by SCPI name; the output state is under
+            ``'OUTP'`` -> ``'STATE'``.
+
+        Raises
+        ------
+        SiglentValidationError
+            If a channel is not 1 or 2.
+        SiglentCommandError
+            If a query fails.
+
+        Examples
+        --------
+        >>> with SiglentSDG2042X() as sig_gen:
+        ...     state = sig_gen.snapshot()
+        ...     print(state[1]['BSWV']['FRQ'], state[2]['OUTP']['STATE'])
+        """
+        self._ensure_connected()
+        for ch in channels:
+            if ch not in [1, 2]:
+                raise SiglentValidationError(
+                    f"Channel must be 1 or 2, got {ch}"
+                )
+
+        result: Dict[int, Dict[str, Dict[str, str]]] = {}
+        for ch in channels:
+            try:
+                result[ch] = {
+                    'BSWV': dict(self._query_bswv(ch)),
+                    'OUTP': dict(self._query_outp(ch)),
+                }
+            except pyvisa.Error as e:
+                raise SiglentCommandError(
+                    f"Failed to read settings of channel {ch}",
+                    pyvisa_error=e
+                )
+        return result
+
+    async def snapshot_async(self, channels: Sequence[int] = (1, 2)) -> Dict[int, Dict[str, Dict[str, str]]]:
+        """
+        Awaitable version of ``snapshot`` that runs in a worker thread.
+
+        The queries for one instrument share a VISA session and are issued in
+        order; the gain comes from awaiting several instruments (or other
+        I/O) together with ``asyncio.gather``.
+
+        Parameters
+        ----------
+        channels : sequence of int, optional
+            Channels to read. Default is (1, 2).
+
+        Returns
+        -------
+        dict[int, dict[str, dict[str, str]]]
+            Same structure as ``snapshot``.
+
+        Examples
+        --------
+        >>> async def read_all(gen_a, gen_b):
+        ...     return await asyncio.gather(gen_a.snapshot_async(), gen_b.snapshot_async())
+        """
+        return await asyncio.to_thread(self.snapshot, channels)
 
+    @_visa_op("Failed to query all parameters on channel {self._active_channel}")
     def get_all_parameters(self) -> str:
         """
         Get all waveform parameters as raw response string.
@@ -1977,15 +2449,9 @@ class SiglentSDG2042X:
         ...     print(params)
         """
         self._ensure_connected()
-        try:
-            instrument = self._get_instrument()
-            response = instrument.query(f'C{self._active_channel}:BSWV?').strip()
-            return response
-        except pyvisa.Error as e:
-            raise SiglentCommandError(
-                f"Failed to query all parameters on channel {self._active_channel}",
-                pyvisa_error=e
-            )
+        ch = self._active_channel
+        self._query_bswv(ch)
+        return self._bswv_cache[ch][1]
 
 
 class PhilipsPM5139:
@@ -2008,10 +2474,13 @@ class PhilipsPM5139:
 
     Attributes
     ----------
-    VALID_WAVEFORMS : list[str]
+    VALID_WAVEFORMS : tuple[str, ...]
         Valid waveform types: 'SINE', 'SQUARE', 'RAMP', 'PULSE', 'ARB', 'DC'.
     limits : ParameterLimits
         Parameter validation limits (PM5139 ranges).
+    cache_ttl : float
+        Seconds a ``*LRN?`` reply is reused by the getters. Default is 0.05;
+        set to 0 to query on every read. Any write invalidates it.
 
     Examples
     --------
@@ -2024,18 +2493,25 @@ class PhilipsPM5139:
     ...     sig_gen.output_state = True
     """
 
-    VALID_WAVEFORMS = ['SINE', 'SQUARE', 'RAMP', 'PULSE', 'ARB', 'DC']
+    __slots__ = (
+        'rm', 'instrument', '_instr', 'resource_name', 'timeout',
+        'limits', '_unit_mode', 'cache_ttl', '_lrn_cache',
+    )
+
+    VALID_WAVEFORMS = ('SINE', 'SQUARE', 'RAMP', 'PULSE', 'ARB', 'DC')
+    _VALID_WAVEFORMS_SET = frozenset(VALID_WAVEFORMS)
+    _VALID_WAVEFORMS_STR = ', '.join(VALID_WAVEFORMS)
 
-    _WAVEFORM_TO_PM5139: Dict[str, str] = {
+    _WAVEFORM_TO_PM5139: Mapping[str, str] = MappingProxyType({
         'SINE': 'SINE',
         'SQUARE': 'SQUARE',
         'RAMP': 'TRNGLE',
         'PULSE': 'POSPULSE',
         'ARB': 'ARB',
         'DC': 'DC',
-    }
+    })
 
-    _PM5139_TO_WAVEFORM: Dict[str, str] = {
+    _PM5139_TO_WAVEFORM: Mapping[str, str] = MappingProxyType({
         'SINE': 'SINE',
         'SQR': 'SQUARE',
         'SQUARE': 'SQUARE',
@@ -2048,7 +2524,7 @@ class PhilipsPM5139:
         'HAVERSINE': 'SINE',
         'ARB': 'ARB',
         'DC': 'DC',
-    }
+    })
 
     def __init__(
         self,
@@ -2056,8 +2532,9 @@ class PhilipsPM5139:
         timeout: int = 5000,
         unit_mode: str = 'tuple'
     ) -> None:
-        self.rm = pyvisa.ResourceManager()
+        self.rm = _get_rm()
         self.instrument: Optional[MessageBasedResource] = None
+        self._instr = cast(MessageBasedResource, None)
         self.resource_name = resource_name
         self.timeout = timeout
         self.limits = ParameterLimits()
@@ -2067,8 +2544,11 @@ class PhilipsPM5139:
         self.limits._amp_max = 20.0
         self.limits._offset_min = -10.0
         self.limits._offset_max = 10.0
+        self.limits._refresh_ranges()
         self._unit_mode: Optional[str] = None
         self.unit_mode = unit_mode
+        self.cache_ttl = 0.05
+        self._lrn_cache: Optional[Tuple[float, str]] = None
 
     def __enter__(self) -> PhilipsPM5139:
         self.connect()
@@ -2083,7 +2563,7 @@ class PhilipsPM5139:
 
     @unit_mode.setter
     def unit_mode(self, value: str) -> None:
-        if value not in ['pint', 'tuple']:
+        if value not in _UNIT_MODES:
             raise SiglentValidationError(
                 f"Unit mode must be 'pint' or 'tuple', got '{value}'"
             )
@@ -2096,18 +2576,14 @@ class PhilipsPM5139:
                 "or call sig_gen.connect() before using properties."
             )
 
-    def _get_instrument(self) -> MessageBasedResource:
-        self._ensure_connected()
-        return cast(MessageBasedResource, self.instrument)
-
     def _extract_value_and_unit(self, value_string: str) -> Tuple[float, str]:
         s = value_string.strip()
-        match = re.match(r'([+-]?[\d.]+(?:[eE][+-]?\d+)?)(.+)?', s)
+        match = _PM5139_VALUE_UNIT_RE.match(s)
         if match:
             value = float(match.group(1))
             unit = match.group(2).strip() if match.group(2) else ''
             return value, unit
-        search = re.search(r'([+-]?[\d.]+(?:[eE][+-]?\d+)?)\s*(.*)', s)
+        search = _NUMBER_SEARCH_RE.search(s)
         if search:
             value = float(search.group(1))
             unit = search.group(2).strip() if search.group(2) else ''
@@ -2115,16 +2591,13 @@ class PhilipsPM5139:
         raise ValueError(f"Could not extract value and unit from: {value_string}")
 
     def _format_quantity(self, value: float, unit_str: str, pint_unit: str) -> Union[Any, Tuple[float, str]]:
-        if self._unit_mode == 'pint' and ureg is not None:
-            return ureg.Quantity(value, pint_unit)
-        return (value, unit_str)
+        if self._unit_mode == 'tuple' or ureg is None:
+            return (value, unit_str)
+        return value * _pint_unit(pint_unit)
 
-    def _configure_serial(self, resource: str) -> None:
+    def _configure_serial(self, instr: MessageBasedResource, resource: str) -> None:
         if not resource.upper().startswith('ASRL'):
             return
-        instr = self.instrument
-        if instr is None:
-            return
         try:
             ser = cast(Any, instr)
             if hasattr(ser, 'baud_rate'):
@@ -2152,7 +2625,7 @@ class PhilipsPM5139:
             try:
                 self.instrument = cast(MessageBasedResource, self.rm.open_resource(self.resource_name))
                 self.instrument.timeout = self.timeout
-                self._configure_serial(self.resource_name)
+                self._configure_serial(self.instrument, self.resource_name)
                 idn = self.instrument.query('*IDN?').strip()
                 if not self._is_pm513x_idn(idn):
                     self.instrument.close()
@@ -2160,6 +2633,7 @@ class PhilipsPM5139:
                     raise SiglentConnectionError(
                         f"Resource {self.resource_name} is not a Philips/Fluke PM5138A/PM5139 (got: {idn})."
                     )
+                self._instr = self.instrument
                 print(f"Connected to: {idn}")
                 print(f"Resource: {self.resource_name}")
                 return
@@ -2175,27 +2649,22 @@ class PhilipsPM5139:
                 "Could not list VISA resources. Ensure NI-VISA is installed and instruments are connected.",
                 pyvisa_error=e
             )
-        for resource in resources:
-            try:
-                test_instr = cast(MessageBasedResource, self.rm.open_resource(resource))
-                test_instr.timeout = 2000
-                self._configure_serial(resource)
-                idn = test_instr.query('*IDN?').strip()
-                if self._is_pm513x_idn(idn):
-                    self.instrument = test_instr
-                    self.instrument.timeout = self.timeout
-                    self.resource_name = resource
-                    print(f"Connected to: {idn}")
-                    print(f"Resource: {resource}")
-                    return
-                test_instr.close()
-            except pyvisa.Error:
-                continue
-        raise SiglentConnectionError(
-            "No Philips/Fluke PM5138A/PM5139 instrument found. Check connections and power."
+        found = _discover(
+            self.rm, list(resources), self._is_pm513x_idn, configure=self._configure_serial
         )
+        if found is None:
+            raise SiglentConnectionError(
+                "No Philips/Fluke PM5138A/PM5139 instrument found. Check connections and power."
+            )
+        resource, test_instr, idn = found
+        test_instr.timeout = self.timeout
+        self.instrument = self._instr = test_instr
+        self.resource_name = resource
+        print(f"Connected to: {idn}")
+        print(f"Resource: {resource}")
 
     def disconnect(self) -> None:
+        self._lrn_cache = None
         if self.instrument:
             try:
                 self.instrument.close()
@@ -2205,6 +2674,7 @@ class PhilipsPM5139:
                     pyvisa_error=e
                 )
             self.instrument = None
+            self._instr = cast(MessageBasedResource, None)
 
     @property
     def channel(self) -> int:
@@ -2221,8 +2691,7 @@ class PhilipsPM5139:
     def frequency(self) -> Union[Any, Tuple[float, str]]:
         self._ensure_connected()
         try:
-            instrument = self._get_instrument()
-            response = instrument.query('FREQ?').strip()
+            response = self._instr.query('FREQ?').strip()
             value, unit_str = self._extract_value_and_unit(response)
             u = unit_str.upper()
             if 'KHZ' in u or 'KH' in u:
@@ -2239,30 +2708,37 @@ class PhilipsPM5139:
     def frequency(self, value: Union[float, int]) -> None:
         self._ensure_connected()
         freq_hz = float(value)
-        if not (self.limits.freq_min <= freq_hz <= self.limits.freq_max):
-            raise SiglentValidationError(
-                f"Frequency {freq_hz} Hz is outside valid range [{self.limits.freq_min}, {self.limits.freq_max}] Hz."
-            )
+        lo, hi = self.limits.freq_range
+        if not (lo <= freq_hz <= hi):
+            raise _range_error('Frequency', freq_hz, 'Hz', lo, hi)
         try:
-            self._get_instrument().write(f'FREQ {freq_hz}')
+            self._write(f'FREQ {freq_hz:.15g}')
         except pyvisa.Error as e:
             raise SiglentCommandError(f"Failed to set frequency to {freq_hz} Hz", pyvisa_error=e)
 
     def _parse_lrn(self) -> str:
-        instrument = self._get_instrument()
-        return instrument.query('*LRN?').strip()
+        cached = self._lrn_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1]
+        lrn = self._instr.query('*LRN?').strip()
+        self._lrn_cache = (now, lrn)
+        return lrn
+
+    def _write(self, command: str) -> None:
+        self._lrn_cache = None
+        self._instr.write(command)
 
     @property
     def amplitude(self) -> Union[Any, Tuple[float, str]]:
         self._ensure_connected()
         try:
             lrn = self._parse_lrn()
-            m = re.search(r'AMPLT(?:UDE)?\s+([+-]?[\d.]+(?:[eE][+-]?\d+)?)', lrn, re.IGNORECASE)
+            m = _LRN_AMPLITUDE_RE.search(lrn)
             if m:
                 value = float(m.group(1))
                 return self._format_quantity(value, 'V', 'volt')
-            instrument = self._get_instrument()
-            response = instrument.query('AMPLTUDE?').strip()
+            response = self._instr.query('AMPLTUDE?').strip()
             value, unit_str = self._extract_value_and_unit(response)
             return self._format_quantity(value, unit_str or 'V', 'volt')
         except pyvisa.Error as e:
@@ -2274,12 +2750,11 @@ class PhilipsPM5139:
     def amplitude(self, value: Union[float, int]) -> None:
         self._ensure_connected()
         amp_v = float(value)
-        if not (self.limits.amp_min <= amp_v <= self.limits.amp_max):
-            raise SiglentValidationError(
-                f"Amplitude {amp_v} V is outside valid range [{self.limits.amp_min}, {self.limits.amp_max}] V."
-            )
+        lo, hi = self.limits.amp_range
+        if not (lo <= amp_v <= hi):
+            raise _range_error('Amplitude', amp_v, 'V', lo, hi)
         try:
-            self._get_instrument().write(f'AMPLTUDE {amp_v}')
+            self._write(f'AMPLTUDE {amp_v:.15g}')
         except pyvisa.Error as e:
             raise SiglentCommandError(f"Failed to set amplitude to {amp_v} V", pyvisa_error=e)
 
@@ -2288,12 +2763,11 @@ class PhilipsPM5139:
         self._ensure_connected()
         try:
             lrn = self._parse_lrn()
-            pattern = re.compile(r'DCOFF(?:SET)?\s+([+-]?[\d.]+(?:[eE][+-]?\d+)?)', re.IGNORECASE)
-            for m in pattern.finditer(lrn):
+            m = _LRN_OFFSET_RE.search(lrn)
+            if m:
                 value = float(m.group(1))
                 return self._format_quantity(value, 'V', 'volt')
-            instrument = self._get_instrument()
-            response = instrument.query('DCOFFSET?').strip()
+            response = self._instr.query('DCOFFSET?').strip()
             value, unit_str = self._extract_value_and_unit(response)
             return self._format_quantity(value, 'V', 'volt')
         except pyvisa.Error as e:
@@ -2305,12 +2779,11 @@ class PhilipsPM5139:
     def offset(self, value: Union[float, int]) -> None:
         self._ensure_connected()
         offset_v = float(value)
-        if not (self.limits.offset_min <= offset_v <= self.limits.offset_max):
-            raise SiglentValidationError(
-                f"Offset {offset_v} V is outside valid range [{self.limits.offset_min}, {self.limits.offset_max}] V."
-            )
+        lo, hi = self.limits.offset_range
+        if not (lo <= offset_v <= hi):
+            raise _range_error('Offset', offset_v, 'V', lo, hi)
         try:
-            self._get_instrument().write(f'DCOFFSET {offset_v}')
+            self._write(f'DCOFFSET {offset_v:.15g}')
         except pyvisa.Error as e:
             raise SiglentCommandError(f"Failed to set offset to {offset_v} V", pyvisa_error=e)
 
@@ -2326,7 +2799,11 @@ class PhilipsPM5139:
     def waveform_type(self) -> str:
         self._ensure_connected()
         try:
-            response = self._get_instrument().query('WAVEFORM?').strip().upper()
+            response = self._instr.query('WAVEFORM?').strip()
+            mapped = self._PM5139_TO_WAVEFORM.get(response)
+            if mapped is not None:
+                return mapped
+            response = response.upper()
             return self._PM5139_TO_WAVEFORM.get(response, response)
         except pyvisa.Error as e:
             raise SiglentCommandError("Failed to query waveform type", pyvisa_error=e)
@@ -2334,21 +2811,21 @@ class PhilipsPM5139:
     @waveform_type.setter
     def waveform_type(self, value: str) -> None:
         self._ensure_connected()
-        uv = value.upper()
-        if uv not in self.VALID_WAVEFORMS:
+        valid = self._VALID_WAVEFORMS_SET
+        uv = value if value in valid else value.upper()
+        if uv not in valid:
             raise SiglentValidationError(
-                f"Invalid waveform type '{value}'. Valid types: {', '.join(self.VALID_WAVEFORMS)}"
+                f"Invalid waveform type '{value}'. Valid types: {self._VALID_WAVEFORMS_STR}"
             )
-        cmd = self._WAVEFORM_TO_PM5139.get(uv, uv)
+        cmd = self._WAVEFORM_TO_PM5139[uv]
         if cmd == 'DC':
             try:
-                self._get_instrument().write('AMPLTUDE 0')
-                self._get_instrument().write('DCON')
+                self._write('AMPLTUDE 0; DCON')
             except pyvisa.Error as e:
                 raise SiglentCommandError("Failed to set DC waveform", pyvisa_error=e)
             return
         try:
-            self._get_instrument().write(f'WAVEFORM {cmd}')
+            self._write(f'WAVEFORM {cmd}')
         except pyvisa.Error as e:
             raise SiglentCommandError(f"Failed to set waveform type to {value}", pyvisa_error=e)
 
@@ -2356,12 +2833,10 @@ class PhilipsPM5139:
     def output_state(self) -> bool:
         self._ensure_connected()
         try:
-            lrn = self._parse_lrn().upper().replace(' ', '')
-            if 'ACOFF' in lrn:
+            lrn = self._parse_lrn()
+            if _ACOFF_RE.search(lrn):
                 return False
-            if 'ACON' in lrn:
-                return True
-            return False
+            return _ACON_RE.search(lrn) is not None
         except pyvisa.Error as e:
             raise SiglentCommandError("Failed to query output state", pyvisa_error=e)
 
@@ -2371,7 +2846,7 @@ class PhilipsPM5139:
         ac = 'ACON' if value else 'ACOFF'
         dc = 'DCON' if value else 'DCOFF'
         try:
-            self._get_instrument().write(f'{ac}; {dc}')
+            self._write(f'{ac}; {dc}')
         except pyvisa.Error as e:
             raise SiglentCommandError(f"Failed to set output state to {value}", pyvisa_error=e)
 
@@ -2379,12 +2854,9 @@ class PhilipsPM5139:
     def load_impedance(self) -> Union[Any, Tuple[float, str], str]:
         self._ensure_connected()
         try:
-            lrn = self._parse_lrn()
-            u = lrn.upper()
-            if 'LOWIMP' in u:
-                rest = u.split('LOWIMP', 1)[-1].strip()
-                if rest.startswith('OFF'):
-                    return self._format_quantity(50.0, 'ohm', 'ohm') if (self._unit_mode == 'pint' and ureg) else (50.0, 'ohm')
+            match = _LOWIMP_RE.search(self._parse_lrn())
+            if match and match.group(1):
+                return self._format_quantity(50.0, 'ohm', 'ohm') if (self._unit_mode == 'pint' and ureg) else (50.0, 'ohm')
             return 'HiZ'
         except pyvisa.Error as e:
             raise SiglentCommandError("Failed to query load impedance", pyvisa_error=e)
@@ -2407,15 +2879,15 @@ class PhilipsPM5139:
             else:
                 raise SiglentValidationError(f"PM5139 supports only 50 ohm or HiZ (low Z); got {value}")
         try:
-            self._get_instrument().write(load_cmd)
+            self._write(load_cmd)
         except pyvisa.Error as e:
             raise SiglentCommandError(f"Failed to set load impedance to {value}", pyvisa_error=e)
 
     def check_connection(self) -> bool:
         self._ensure_connected()
         try:
-            idn = self._get_instrument().query('*IDN?')
-            print(f"Instrument responding: {idn.strip()}")
+            idn = self._instr.query('*IDN?').strip()
+            logger.debug("Instrument responding: %s", idn)
             return True
         except pyvisa.Error as e:
             raise SiglentCommandError("Communication error during connection check", pyvisa_error=e)
@@ -2423,7 +2895,7 @@ class PhilipsPM5139:
     def reset(self) -> None:
         self._ensure_connected()
         try:
-            self._get_instrument().write('*RST')
+            self._write('*RST')
         except pyvisa.Error as e:
             raise SiglentCommandError("Reset command failed", pyvisa_error=e)
 
@@ -2435,7 +2907,7 @@ class PhilipsPM5139:
             raise SiglentCommandError("Failed to query all parameters", pyvisa_error=e)
 
     def list_waveforms(self) -> List[Dict[str, str]]:
-        return [{'index': str(i), 'name': f'ARB{i}'} for i in range(1, 25)]
+        return list(_PM5139_ARB_LIST)
 
     def select_arbitrary_waveform(self, index: Optional[int] = None, name: Optional[str] = None) -> None:
         self._ensure_connected()
@@ -2449,16 +2921,16 @@ class PhilipsPM5139:
             if not (1 <= index <= 24):
                 raise SiglentValidationError(f"ARB index must be 1-24, got {index}")
             try:
-                self._get_instrument().write(f'ARBITRARY {index}')
+                self._write(f'ARBITRARY {index}')
             except pyvisa.Error as e:
                 raise SiglentCommandError("Failed to select arbitrary waveform", pyvisa_error=e)
             return
         if name is not None:
-            match = re.match(r'ARB(\d+)', name.upper())
-            if match:
-                idx = int(match.group(1))
+            up = name.upper()
+            if up.startswith('ARB') and up[3:].isdecimal():
+                idx = int(up[3:])
                 if 1 <= idx <= 24:
-                    self._get_instrument().write(f'ARBITRARY {idx}')
+                    self._write(f'ARBITRARY {idx}')
                     return
             raise SiglentValidationError(
                 "PM5139 supports selection by index (1-24) only; name must match ARB<n>."
@@ -2467,7 +2939,7 @@ class PhilipsPM5139:
     def get_duty_cycle(self) -> Union[Any, Tuple[float, str]]:
         self._ensure_connected()
         try:
-            response = self._get_instrument().query('DUTYCYCLE?').strip()
+            response = self._instr.query('DUTYCYCLE?').strip()
             value, unit_str = self._extract_value_and_unit(response)
             return self._format_quantity(value, unit_str or '%', 'percent')
         except pyvisa.Error:
@@ -2475,7 +2947,7 @@ class PhilipsPM5139:
                 lrn = self._parse_lrn()
                 for part in lrn.split(';'):
                     if 'DUTYCYCLE' in part.upper() or 'DUTY' in part.upper():
-                        m = re.search(r'([+-]?[\d.]+)', part)
+                        m = _NUMBER_RE.search(part)
                         if m:
                             v = float(m.group(1))
                             return self._format_quantity(v, '%', 'percent')
@@ -2489,7 +2961,7 @@ class PhilipsPM5139:
         if not (0 <= duty_percent <= 100):
             raise SiglentValidationError(f"Duty cycle must be between 0 and 100%, got {duty_percent}%")
         try:
-            self._get_instrument().write(f'DUTYCYCLE {duty_percent}')
+            self._write(f'DUTYCYCLE {duty_percent:.15g}')
         except pyvisa.Error as e:
             raise SiglentCommandError(f"Failed to set duty cycle to {duty_percent}%", pyvisa_error=e)
 
@@ -2510,10 +2982,9 @@ class PhilipsPM5139:
             raise SiglentValidationError(f"Symmetry must be between 0 and 100%, got {sym_percent}%")
         try:
             if abs(sym_percent - 50.0) < 0.01:
-                self._get_instrument().write('SYMMETRY ON')
+                self._write('SYMMETRY ON')
             else:
-                self._get_instrument().write('SYMMETRY OFF')
-                self._get_instrument().write(f'DUTYCYCLE {sym_percent}')
+                self._write(f'SYMMETRY OFF; DUTYCYCLE {sym_percent:.15g}')
         except pyvisa.Error as e:
             raise SiglentCommandError(f"Failed to set symmetry to {sym_percent}%", pyvisa_error=e)
 
@@ -2544,39 +3015,36 @@ class PhilipsPM5139:
         phase: Union[float, int] = 0
     ) -> None:
         self._ensure_connected()
-        uv = waveform_type.upper()
-        if uv not in self.VALID_WAVEFORMS:
+        valid = self._VALID_WAVEFORMS_SET
+        uv = waveform_type if waveform_type in valid else waveform_type.upper()
+        if uv not in valid:
             raise SiglentValidationError(
-                f"Invalid waveform type '{waveform_type}'. Valid types: {', '.join(self.VALID_WAVEFORMS)}"
+                f"Invalid waveform type '{waveform_type}'. Valid types: {self._VALID_WAVEFORMS_STR}"
             )
         freq_hz = float(frequency)
         amp_v = float(amplitude)
         offset_v = float(offset)
-        if not (self.limits.freq_min <= freq_hz <= self.limits.freq_max):
-            raise SiglentValidationError(
-                f"Frequency {freq_hz} Hz is outside valid range [{self.limits.freq_min}, {self.limits.freq_max}] Hz."
-            )
-        if not (self.limits.amp_min <= amp_v <= self.limits.amp_max):
-            raise SiglentValidationError(
-                f"Amplitude {amp_v} V is outside valid range [{self.limits.amp_min}, {self.limits.amp_max}] V."
-            )
-        if not (self.limits.offset_min <= offset_v <= self.limits.offset_max):
-            raise SiglentValidationError(
-                f"Offset {offset_v} V is outside valid range [{self.limits.offset_min}, {self.limits.offset_max}] V."
-            )
+        lo, hi = self.limits.freq_range
+        if not (lo <= freq_hz <= hi):
+            raise _range_error('Frequency', freq_hz, 'Hz', lo, hi)
+        lo, hi = self.limits.amp_range
+        if not (lo <= amp_v <= hi):
+            raise _range_error('Amplitude', amp_v, 'V', lo, hi)
+        lo, hi = self.limits.offset_range
+        if not (lo <= offset_v <= hi):
+            raise _range_error('Offset', offset_v, 'V', lo, hi)
         if abs(offset_v) + amp_v / 2 > 10:
             raise SiglentValidationError(
                 "AC peak + DC offset must not exceed +/-10 V."
             )
-        cmd = self._WAVEFORM_TO_PM5139.get(uv, uv)
+        cmd = self._WAVEFORM_TO_PM5139[uv]
         try:
-            instr = self._get_instrument()
             if cmd == 'DC':
-                instr.write('AMPLTUDE 0')
-                instr.write('DCOFFSET 0')
-                instr.write('DCON')
+                self._write('AMPLTUDE 0; DCOFFSET 0; DCON')
             else:
-                instr.write(f'WAVEFORM {cmd}; FREQ {freq_hz}; AMPLTUDE {amp_v}; DCOFFSET {offset_v}')
+                self._write(
+                    f'WAVEFORM {cmd}; FREQ {freq_hz:.15g}; AMPLTUDE {amp_v:.15g}; DCOFFSET {offset_v:.15g}'
+                )
         except pyvisa.Error as e:
             raise SiglentCommandError(
                 f"Failed to configure waveform: type={waveform_type}, freq={freq_hz}, amp={amp_v}, offset={offset_v}",
@@ -0,0 +1,123 @@
+"""Fake VISA resources shared by the driver tests."""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pyvisa
+import pytest
+
+import inst_ctrl.sig_gen
+from inst_ctrl import RigolDP800, SiglentSDG2042X
+
+RIGOL_IDN = 'RIGOL TECHNOLOGIES,DP832,DP8C00000001,00.01.16'
+SIGLENT_IDN = 'Siglent Technologies,SDG2042X,SDG2XCAX0R0001,2.01.01.35R1'
+
+RIGOL_RESOURCE = 'TCPIP0::192.168.1.100::INSTR'
+SIGLENT_RESOURCE = 'USB0::0x0483::0x7540::SDG2XCAX0R0001::INSTR'
+
+
+class FakeResource:
+    """
+    Stand-in for a MessageBasedResource that records every call.
+
+    Writes and queries are appended to ``log`` as ``('w', command)`` and
+    ``('q', command)`` in the order the resource sees them. A command
+    containing ``fail_on`` raises a VISA timeout, and each write sleeps
+    ``write_delay`` seconds so queued writes are still pending when the
+    caller moves on.
+    """
+
+    def __init__(self, responder: Callable[[str], str]) -> None:
+        self.responder = responder
+        self.log: List[Tuple[str, str]] = []
+        self.fail_on: Optional[str] = None
+        self.write_delay = 0.0
+        self.closed = False
+
+    def _check(self, command: str) -> None:
+        if self.fail_on is not None and self.fail_on in command:
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+
+    def write(self, command: str) -> int:
+        time.sleep(self.write_delay)
+        self._check(command)
+        self.log.append(('w', command))
+        return len(command)
+
+    def write_raw(self, message: bytes) -> int:
+        self.write(message.decode('ascii').rstrip('\n'))
+        return len(message)
+
+    def query(self, command: str) -> str:
+        self._check(command)
+        self.log.append(('q', command))
+        return self.responder(command)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeResourceManager:
+    """Stand-in for pyvisa.ResourceManager serving FakeResource objects."""
+
+    def __init__(self, responders: Dict[str, Callable[[str], str]]) -> None:
+        self.responders = responders
+        self.opened: List[FakeResource] = []
+
+    def list_resources(self) -> Tuple[str, ...]:
+        return tuple(self.responders)
+
+    def open_resource(self, resource_name: str) -> FakeResource:
+        try:
+            responder = self.responders[resource_name]
+        except KeyError:
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_resource_not_found)
+        resource = FakeResource(responder)
+        self.opened.append(resource)
+        return resource
+
+
+def rigol_responder(command: str) -> str:
+    if command.startswith('*IDN?'):
+        return RIGOL_IDN
+    if command.startswith(':OUTPut:STATe?'):
+        return 'OFF'
+    return '1'
+
+
+def siglent_responder(command: str) -> str:
+    if command.startswith('*IDN?'):
+        return SIGLENT_IDN
+    if command.endswith(':BSWV?'):
+        return f'{command[:2]}:BSWV WVTP,SINE,FRQ,1000HZ,AMP,2V,OFST,0V,PHSE,0'
+    if command.endswith(':OUTP?'):
+        return f'{command[:2]}:OUTP OFF,LOAD,HZ,PLRT,NOR'
+    return '1'
+
+
+@pytest.fixture
+def fake_rm(monkeypatch: pytest.MonkeyPatch) -> FakeResourceManager:
+    """Route pyvisa.ResourceManager() to a fake serving both instruments."""
+    rm = FakeResourceManager({
+        RIGOL_RESOURCE: rigol_responder,
+        SIGLENT_RESOURCE: siglent_responder,
+    })
+    monkeypatch.setattr(pyvisa, 'ResourceManager', lambda *args, **kwargs: rm)
+    monkeypatch.setattr(inst_ctrl.sig_gen, '_rm', None)
+    return rm
+
+
+@pytest.fixture
+def psu(fake_rm: FakeResourceManager) -> RigolDP800:
+    """RigolDP800 connected to a fake resource."""
+    instrument = RigolDP800(ip_address='192.168.1.100')
+    instrument.connect()
+    return instrument
+
+
+@pytest.fixture
+def sig_gen(fake_rm: FakeResourceManager) -> SiglentSDG2042X:
+    """SiglentSDG2042X connected to a fake resource."""
+    instrument = SiglentSDG2042X(resource_name=SIGLENT_RESOURCE)
+    instrument.connect()
+    return instrument
@@ -0,0 +1,118 @@
+"""RigolDP800 batching and asynchronous writes against a fake resource."""
+
+import time
+
+import pytest
+
+from inst_ctrl import Channel, RigolCommandError, RigolDP800
+
+
+def test_nested_batch_joins_outer(psu: RigolDP800) -> None:
+    log = psu.instrument.log
+    del log[:]
+    with psu.batch():
+        psu.set_ovp(15.0, Channel.CH1)
+        with psu.batch():
+            psu.set_ocp(2.0, Channel.CH1)
+        assert log == []
+        psu.output_on(Channel.CH1)
+    assert log == [(
+        'q',
+        ':OUTPut:OVP:VALue CH1,15.0;:OUTPut:OCP:VALue CH1,2.0;:OUTPut CH1,ON;*OPC?',
+    )]
+
+
+def test_nested_batch_rollback_keeps_outer(psu: RigolDP800) -> None:
+    log = psu.instrument.log
+    del log[:]
+    with psu.batch():
+        psu.set_ovp(15.0, Channel.CH1)
+        with pytest.raises(RuntimeError):
+            with psu.batch():
+                psu.set_ocp(2.0, Channel.CH1)
+                raise RuntimeError
+        psu.output_on(Channel.CH1)
+    assert log == [('q', ':OUTPut:OVP:VALue CH1,15.0;:OUTPut CH1,ON;*OPC?')]
+
+
+def test_outer_batch_rollback_sends_nothing(psu: RigolDP800) -> None:
+    log = psu.instrument.log
+    del log[:]
+    with pytest.raises(RuntimeError):
+        with psu.batch():
+            psu.set_ovp(15.0, Channel.CH1)
+            with psu.batch():
+                psu.set_ocp(2.0, Channel.CH1)
+            raise RuntimeError
+    assert log == []
+    psu.output_on(Channel.CH1)
+    assert log == [('w', ':OUTPut CH1,ON')]
+
+
+def test_explicit_begin_batch_nests(psu: RigolDP800) -> None:
+    log = psu.instrument.log
+    del log[:]
+    psu.begin_batch()
+    psu.output_on(Channel.CH1)
+    psu.begin_batch()
+    psu.output_on(Channel.CH2)
+    psu.commit()
+    assert log == []
+    psu.commit()
+    assert log == [('q', ':OUTPut CH1,ON;:OUTPut CH2,ON;*OPC?')]
+
+
+def test_async_writes_finish_before_query(psu: RigolDP800) -> None:
+    psu.async_writes = True
+    psu.instrument.write_delay = 0.02
+    log = psu.instrument.log
+    del log[:]
+    psu.output_on(Channel.CH1)
+    psu.set_ovp(15.0, Channel.CH1)
+    psu.output
+    assert log == [
+        ('w', ':OUTPut CH1,ON'),
+        ('w', ':OUTPut:OVP:VALue CH1,15.0'),
+        ('q', ':OUTPut:STATe? CH1'),
+    ]
+
+
+def test_async_writes_finish_before_direct_write(psu: RigolDP800) -> None:
+    psu.async_writes = True
+    psu.instrument.write_delay = 0.02
+    log = psu.instrument.log
+    del log[:]
+    psu.output_on(Channel.CH1)
+    psu.async_writes = False
+    psu.output_on(Channel.CH2)
+    assert log == [('w', ':OUTPut CH1,ON'), ('w', ':OUTPut CH2,ON')]
+
+
+def test_flush_raises_failed_async_write(psu: RigolDP800) -> None:
+    psu.async_writes = True
+    psu.instrument.fail_on = 'CH2'
+    psu.output_on(Channel.CH2)
+    with pytest.raises(RigolCommandError, match='CH2,ON'):
+        psu.flush()
+    psu.instrument.fail_on = None
+    psu.flush()
+
+
+def test_next_call_raises_failed_async_write(psu: RigolDP800) -> None:
+    psu.async_writes = True
+    psu.instrument.fail_on = 'CH2'
+    psu.output_on(Channel.CH2)
+    time.sleep(0.05)
+    with pytest.raises(RigolCommandError, match='Asynchronous write'):
+        psu.output_on(Channel.CH1)
+
+
+def test_disconnect_raises_failed_async_write(psu: RigolDP800) -> None:
+    resource = psu.instrument
+    psu.async_writes = True
+    resource.fail_on = 'CH2'
+    psu.output_on(Channel.CH2)
+    with pytest.raises(RigolCommandError, match='CH2,ON'):
+        psu.disconnect()
+    assert resource.closed
+    assert psu.instrument is None
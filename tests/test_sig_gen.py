@@ -0,0 +1,102 @@
+"""SiglentSDG2042X transactions and pipelined writes against a fake resource."""
+
+import time
+
+import pytest
+
+from inst_ctrl import SiglentCommandError, SiglentSDG2042X
+
+
+def test_nested_transaction_joins_outer(sig_gen: SiglentSDG2042X) -> None:
+    log = sig_gen.instrument.log
+    del log[:]
+    with sig_gen.transaction():
+        sig_gen.phase = 45
+        with sig_gen.transaction():
+            sig_gen.output_state = True
+        assert log == []
+        sig_gen.phase = 90
+    assert log == [('w', 'C1:BSWV PHSE,45;C1:OUTP ON;C1:BSWV PHSE,90')]
+
+
+def test_nested_transaction_rollback_keeps_outer(sig_gen: SiglentSDG2042X) -> None:
+    log = sig_gen.instrument.log
+    del log[:]
+    with sig_gen.transaction():
+        sig_gen.phase = 45
+        with pytest.raises(RuntimeError):
+            with sig_gen.transaction():
+                sig_gen.output_state = True
+                raise RuntimeError
+        sig_gen.phase = 90
+    assert log == [('w', 'C1:BSWV PHSE,45;C1:BSWV PHSE,90')]
+
+
+def test_outer_transaction_rollback_sends_nothing(sig_gen: SiglentSDG2042X) -> None:
+    log = sig_gen.instrument.log
+    del log[:]
+    with pytest.raises(RuntimeError):
+        with sig_gen.transaction():
+            sig_gen.phase = 45
+            with sig_gen.transaction():
+                sig_gen.output_state = True
+            raise RuntimeError
+    assert log == []
+    sig_gen.phase = 90
+    assert log == [('w', 'C1:BSWV PHSE,90')]
+
+
+def test_pipelined_writes_finish_before_query(sig_gen: SiglentSDG2042X) -> None:
+    sig_gen.pipelined = True
+    sig_gen.instrument.write_delay = 0.02
+    log = sig_gen.instrument.log
+    del log[:]
+    sig_gen.phase = 45
+    sig_gen.output_state = True
+    sig_gen.frequency
+    assert log == [
+        ('w', 'C1:BSWV PHSE,45'),
+        ('w', 'C1:OUTP ON'),
+        ('q', 'C1:BSWV?'),
+    ]
+
+
+def test_pipelined_writes_finish_before_direct_write(sig_gen: SiglentSDG2042X) -> None:
+    sig_gen.pipelined = True
+    sig_gen.instrument.write_delay = 0.02
+    log = sig_gen.instrument.log
+    del log[:]
+    sig_gen.phase = 45
+    sig_gen.pipelined = False
+    sig_gen.phase = 90
+    assert log == [('w', 'C1:BSWV PHSE,45'), ('w', 'C1:BSWV PHSE,90')]
+
+
+def test_flush_raises_failed_pipelined_write(sig_gen: SiglentSDG2042X) -> None:
+    sig_gen.pipelined = True
+    sig_gen.instrument.fail_on = 'PHSE'
+    sig_gen.phase = 45
+    with pytest.raises(SiglentCommandError, match="'C1:BSWV PHSE,45'"):
+        sig_gen.flush()
+    sig_gen.instrument.fail_on = None
+    sig_gen.flush()
+
+
+def test_query_names_failed_pipelined_write(sig_gen: SiglentSDG2042X) -> None:
+    sig_gen.pipelined = True
+    sig_gen.instrument.fail_on = 'PHSE'
+    sig_gen.phase = 45
+    time.sleep(0.05)
+    with pytest.raises(SiglentCommandError, match="Queued write 'C1:BSWV PHSE,45' failed"):
+        sig_gen.frequency
+
+
+def test_disconnect_raises_failed_pipelined_write(sig_gen: SiglentSDG2042X) -> None:
+    resource = sig_gen.instrument
+    sig_gen.pipelined = True
+    resource.fail_on = 'PHSE'
+    sig_gen.phase = 45
+    with pytest.raises(SiglentCommandError, match="'C1:BSWV PHSE,45'"):
+        sig_gen.disconnect()
+    assert resource.closed
+    assert sig_gen.instrument is None